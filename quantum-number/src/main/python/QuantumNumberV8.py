@@ -1,3 +1,34 @@
+from functools import lru_cache
+
+
+def _ptr_id(ptr):
+    # Helper to print pointer ids or None
+    return hex(id(ptr)) if ptr else "None"
+
+
+# The six +1/-1 multipliers of a..f for each of the 64 states of the sign
+# bits, so SIGN_LUT[signs & 0b111111][i] replaces 1 - 2 * ((signs >> i) & 1)
+SIGN_LUT = [tuple(1 - 2 * ((s >> i) & 1) for i in range(6)) for s in range(64)]
+
+
+@lru_cache(maxsize=4096, typed=True)
+def add_terms(a1, b1, c1, signs1, a2, b2, c2, signs2):
+    """
+    Sign-aware sum of the a,b,c terms of two numbers, as the magnitudes of
+    the sums plus their sign bits (signs1/signs2 hold only the a,b,c bits).
+
+    Memoized: the result is a pure function of these values, and typed=True
+    keeps int and float operands apart. add_terms.cache_clear() resets it,
+    e.g. between benchmark runs.
+    """
+    m1 = SIGN_LUT[signs1]
+    m2 = SIGN_LUT[signs2]
+    sa = a1 * m1[0] + a2 * m2[0]
+    sb = b1 * m1[1] + b2 * m2[1]
+    sc = c1 * m1[2] + c2 * m2[2]
+    return abs(sa), abs(sb), abs(sc), (sa < 0) | ((sb < 0) << 1) | ((sc < 0) << 2)
+
+
 class QuantumNumberV8:
     """
     Represents a symbolic, exact, and mutable numeric unit designed for
@@ -16,6 +47,13 @@ class QuantumNumberV8:
     left, right, up, down, in, out — to form a multidirectional linked structure.
     """
 
+    __slots__ = ('signs', 'metadata', 'a', 'b', 'c', 'd', 'e', 'f',
+                 'left', 'right', 'up', 'down', 'in_', 'out')
+
+    # Set to False on the class to drop the pointer ids from __repr__,
+    # e.g. for logging-heavy runs that only care about the coefficients
+    full_repr = True
+
     def __init__(self):
         self.signs = 0
         self.metadata = 0
@@ -35,14 +73,208 @@ class QuantumNumberV8:
         self.in_ = None  # 'in' is a Python keyword
         self.out = None
 
+    def reset(self):
+        """
+        Return this number to its freshly constructed state in place, so
+        reducers can reuse one output without reallocating.
+        """
+        self.signs = 0
+        self.metadata = 0
+
+        self.a = 0
+        self.b = 0
+        self.c = 0
+        self.d = 0
+        self.e = 0
+        self.f = 0
+
+        self.left = None
+        self.right = None
+        self.up = None
+        self.down = None
+        self.in_ = None
+        self.out = None
+
     def __repr__(self):
-        # Helper to print pointer ids or None
-        def ptr_id(ptr):
-            return hex(id(ptr)) if ptr else "None"
+        if not self.full_repr:
+            return (
+                f"QuantumNumberV8(signs={self.signs}, metadata={self.metadata}, "
+                f"a={self.a}, b={self.b}, c={self.c}, d={self.d}, e={self.e}, f={self.f})"
+            )
 
         return (
             f"QuantumNumberV8(signs={self.signs}, metadata={self.metadata},\n"
             f"  a={self.a}, b={self.b}, c={self.c}, d={self.d}, e={self.e}, f={self.f},\n"
-            f"  left={ptr_id(self.left)}, right={ptr_id(self.right)}, up={ptr_id(self.up)}, down={ptr_id(self.down)},\n"
-            f"  in_={ptr_id(self.in_)}, out={ptr_id(self.out)})"
+            f"  left={_ptr_id(self.left)}, right={_ptr_id(self.right)}, up={_ptr_id(self.up)}, down={_ptr_id(self.down)},\n"
+            f"  in_={_ptr_id(self.in_)}, out={_ptr_id(self.out)})"
         )
+
+
+class QNumBatch:
+    """
+    Struct-of-arrays snapshot of a sequence of QuantumNumberV8: one list per
+    coefficient a..f plus the signs and metadata columns, so reductions across
+    many numbers run column by column instead of object by object.
+
+    The columns are copies; writing to them does not touch the source numbers.
+    """
+
+    __slots__ = ('a', 'b', 'c', 'd', 'e', 'f', 'signs', 'metadata')
+
+    def __init__(self, qnums=()):
+        qnums = list(qnums)
+        self.a = [q.a for q in qnums]
+        self.b = [q.b for q in qnums]
+        self.c = [q.c for q in qnums]
+        self.d = [q.d for q in qnums]
+        self.e = [q.e for q in qnums]
+        self.f = [q.f for q in qnums]
+        self.signs = [q.signs for q in qnums]
+        self.metadata = [q.metadata for q in qnums]
+
+    def __len__(self):
+        return len(self.signs)
+
+
+def merged_metadata(first, second):
+    """
+    Metadata of a number derived from two metadata columns.
+    Metadata is a version counter, so this is the largest value in either
+    column, or 0 when both are empty.
+    """
+    first_max = max(first, default=0)
+    second_max = max(second, default=0)
+    return first_max if first_max >= second_max else second_max
+
+
+def coef_property(index, name):
+    """Property naming entry index of the owner's contiguous coef sequence."""
+    def fget(self):
+        return self.coef[index]
+
+    def fset(self, value):
+        self.coef[index] = value
+
+    return property(fget, fset, doc=f"Coefficient {name}, stored as coef[{index}].")
+
+
+# Owner column suffixes of the a, b, c, signs and metadata fields, in the
+# order a QNumColumns view binds them
+_COLUMN_SUFFIXES = ('a', 'b', 'c', 's', 'm')
+
+
+def _column_property(field, position):
+    # One field of a QNumRow: entry _index of the bound column at position
+    def fget(self):
+        return self._columns[position][self._index]
+
+    def fset(self, value):
+        self._columns[position][self._index] = value
+
+    return property(fget, fset, doc=f"Field {field}, stored in the owner's <prefix>{_COLUMN_SUFFIXES[position]} column.")
+
+
+def _fixed_property(field, value):
+    # Field without a column: reads as in a new QuantumNumberV8, cannot be set
+    def fget(self):
+        return value
+
+    return property(fget, doc=f"Field {field}, always {value!r} for a column-backed row.")
+
+
+class QNumRow:
+    """
+    One number of a QNumColumns view. Its fields are read from and written
+    to the owner's column lists, so a row stays current as long as the
+    owner updates those lists in place rather than rebinding them.
+    """
+
+    __slots__ = ('_columns', '_index')
+
+    a = _column_property('a', 0)
+    b = _column_property('b', 1)
+    c = _column_property('c', 2)
+    signs = _column_property('signs', 3)
+    metadata = _column_property('metadata', 4)
+
+    d = _fixed_property('d', 0)
+    e = _fixed_property('e', 0)
+    f = _fixed_property('f', 0)
+    left = _fixed_property('left', None)
+    right = _fixed_property('right', None)
+    up = _fixed_property('up', None)
+    down = _fixed_property('down', None)
+    in_ = _fixed_property('in_', None)
+    out = _fixed_property('out', None)
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    def to_qnum(self):
+        """Detached QuantumNumberV8 copy of this row."""
+        q = QuantumNumberV8()
+        q.signs = self.signs
+        q.metadata = self.metadata
+        q.a = self.a
+        q.b = self.b
+        q.c = self.c
+        return q
+
+    def __repr__(self):
+        return repr(self.to_qnum())
+
+
+class QNumColumns:
+    """
+    List-like QuantumNumberV8 view of numbers that an owner object stores
+    column-wise, as the lists <prefix>a, <prefix>b, <prefix>c, <prefix>s
+    (signs) and <prefix>m (metadata).
+
+    Unlike QNumBatch this is not a copy: the column lists are bound once
+    when the view is made, rows index them directly, and writes through a
+    row or item assignment update them.
+    """
+
+    __slots__ = ('_columns',)
+
+    def __init__(self, owner, prefix):
+        self._columns = tuple(getattr(owner, prefix + suffix) for suffix in _COLUMN_SUFFIXES)
+
+    def __len__(self):
+        return len(self._columns[3])
+
+    def _row(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("QNumColumns index out of range")
+        return QNumRow(self._columns, index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        return self._row(index)
+
+    def __setitem__(self, index, qnum):
+        # Copy the column-backed fields of qnum into the row
+        row = self._row(index)
+        row.a = qnum.a
+        row.b = qnum.b
+        row.c = qnum.c
+        row.signs = qnum.signs
+        row.metadata = qnum.metadata
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield QNumRow(self._columns, i)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def column_view(prefix):
+    """Read-only property giving the owner's <prefix> columns as a QNumColumns view."""
+    return property(lambda self: QNumColumns(self, prefix),
+                    doc=f"QuantumNumberV8 view of the {prefix}a/{prefix}b/{prefix}c/{prefix}s/{prefix}m columns.")
@@ -1,91 +1,61 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import reduce
+from operator import mul, or_
+
+from QuantumNumberV8 import QuantumNumberV8, column_view, merged_metadata
+
+def _weighted_sum(fa, wa, fs, ws, fm, wm):
+    # Column kernel: 'a' term, signs and metadata of sum(features * weights)
+    return (
+        sum(map(mul, fa, wa)),
+        reduce(or_, fs, 0) | reduce(or_, ws, 0),
+        merged_metadata(fm, wm),
+    )
+
+def _sgd(w, f, lr, error):
+    # Column kernel: element-wise w + lr * error * f
+    return [wi + lr * (error * fi) for fi, wi in zip(f, w)]
 
 class QuantumNumberV8Demo10:
+    # QuantumNumberV8 views of the feature and weight columns; writes through
+    # a row update the columns
+    features = column_view('f')
+    weights = column_view('w')
+
     def __init__(self):
-        self.features = []
-        q0 = QuantumNumberV8()
-        q0.signs = 0b001
-        q0.a = 3
-        q0.b = 2
-        q0.c = 1
-        q0.metadata = 1
-        self.features.append(q0)
-
-        q1 = QuantumNumberV8()
-        q1.signs = 0b010
-        q1.a = -4
-        q1.b = 1
-        q1.c = 2
-        q1.metadata = 1
-        self.features.append(q1)
-
-        q2 = QuantumNumberV8()
-        q2.signs = 0b100
-        q2.a = 5
-        q2.b = -3
-        q2.c = 1
-        q2.metadata = 1
-        self.features.append(q2)
-
-        self.weights = []
-        w0 = QuantumNumberV8()
-        w0.signs = 0b000
-        w0.a = 1
-        w0.b = 1
-        w0.c = 1
-        w0.metadata = 1
-        self.weights.append(w0)
-
-        w1 = QuantumNumberV8()
-        w1.signs = 0b001
-        w1.a = -1
-        w1.b = 1
-        w1.c = 2
-        w1.metadata = 1
-        self.weights.append(w1)
-
-        w2 = QuantumNumberV8()
-        w2.signs = 0b010
-        w2.a = 2
-        w2.b = -1
-        w2.c = 1
-        w2.metadata = 1
-        self.weights.append(w2)
+        # Features and weights are stored column-wise, one list per field,
+        # so the training loop works on whole columns instead of node objects
+        self.fa = [3, -4, 5]
+        self.fb = [2, 1, -3]
+        self.fc = [1, 2, 1]
+        self.fs = [0b001, 0b010, 0b100]
+        self.fm = [1, 1, 1]
+
+        self.wa = [1, -1, 2]
+        self.wb = [1, 1, -1]
+        self.wc = [1, 2, 1]
+        self.ws = [0b000, 0b001, 0b010]
+        self.wm = [1, 1, 1]
 
         self.learning_rate = 0.1
-
-    def multiply_feature_weight(self, feature, weight):
-        # Element-wise multiply a,b,c terms and combine signs and metadata
-        result = QuantumNumberV8()
-        result.a = feature.a * weight.a
-        result.b = feature.b * weight.b
-        result.c = feature.c * weight.c
-        result.signs = feature.signs | weight.signs
-        result.metadata = max(feature.metadata, weight.metadata)
-        return result
+        self.verbose = False  # print every weight update in gradient_step
 
     def weighted_sum(self):
         # Weighted sum of features * weights on 'a' terms with signs
         total = QuantumNumberV8()
-        total.a = 0
-        total.signs = 0
-        total.metadata = 0
-        for f, w in zip(self.features, self.weights):
-            mul = self.multiply_feature_weight(f, w)
-            total.a += mul.a
-            total.signs |= mul.signs
-            total.metadata = max(total.metadata, mul.metadata)
+        total.a, total.signs, total.metadata = _weighted_sum(
+            self.fa, self.wa, self.fs, self.ws, self.fm, self.wm)
         return total
 
     def gradient_step(self, output, target):
         # Simple gradient descent update for weights based on difference
         error = target - output.a
-        print(f"Error: {error}")
+        if self.verbose:
+            print(f"Error: {error}")
 
-        for i, (f, w) in enumerate(zip(self.features, self.weights)):
-            grad = error * f.a
-            w.a += self.learning_rate * grad
-            print(f"Updated weight[{i}].a: {w.a:.4f}")
+        self.wa[:] = _sgd(self.wa, self.fa, self.learning_rate, error)
+        if self.verbose:
+            for i, w in enumerate(self.wa):
+                print(f"Updated weight[{i}].a: {w:.4f}")
 
     def run(self):
         print("Initial features:")
@@ -109,4 +79,5 @@ class QuantumNumberV8Demo10:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo10()
+    demo.verbose = True
     demo.run()
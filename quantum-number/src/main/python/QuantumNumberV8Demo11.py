@@ -1,121 +1,93 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import reduce
+from operator import add, mul, or_
+
+from QuantumNumberV8 import QuantumNumberV8, column_view, merged_metadata
+
+# (term, sign bit) pairs handled by relu_activation
+_ABC_BITS = (('a', 0), ('b', 1), ('c', 2))
+
+def _weighted_sum(fa, fb, fc, wa, wb, wc, fs, ws, fm, wm):
+    # Column kernel: a,b,c terms, signs and metadata of sum(features * weights)
+    return (
+        sum(map(mul, fa, wa)),
+        sum(map(mul, fb, wb)),
+        sum(map(mul, fc, wc)),
+        reduce(or_, fs, 0) | reduce(or_, ws, 0),
+        merged_metadata(fm, wm),
+    )
+
+def _momentum_sgd(w, v, f, lr, momentum, error):
+    # Column kernel: momentum update of v, then w + v, element-wise
+    v = [momentum * vi + lr * (error * fi) for fi, vi in zip(f, v)]
+    return list(map(add, w, v)), v
 
 class QuantumNumberV8Demo11:
+    # QuantumNumberV8 views of the feature and weight columns; writes through
+    # a row update the columns
+    features = column_view('f')
+    weights = column_view('w')
+
     def __init__(self):
-        self.features = []
-        q0 = QuantumNumberV8()
-        q0.signs = 0b001
-        q0.a = 3
-        q0.b = 2
-        q0.c = 1
-        q0.metadata = 1
-        self.features.append(q0)
-
-        q1 = QuantumNumberV8()
-        q1.signs = 0b010
-        q1.a = -4
-        q1.b = 1
-        q1.c = 2
-        q1.metadata = 1
-        self.features.append(q1)
-
-        q2 = QuantumNumberV8()
-        q2.signs = 0b100
-        q2.a = 5
-        q2.b = -3
-        q2.c = 1
-        q2.metadata = 1
-        self.features.append(q2)
-
-        self.weights = []
-        w0 = QuantumNumberV8()
-        w0.signs = 0b000
-        w0.a = 1
-        w0.b = 1
-        w0.c = 1
-        w0.metadata = 1
-        self.weights.append(w0)
-
-        w1 = QuantumNumberV8()
-        w1.signs = 0b001
-        w1.a = -1
-        w1.b = 1
-        w1.c = 2
-        w1.metadata = 1
-        self.weights.append(w1)
-
-        w2 = QuantumNumberV8()
-        w2.signs = 0b010
-        w2.a = 2
-        w2.b = -1
-        w2.c = 1
-        w2.metadata = 1
-        self.weights.append(w2)
+        # Features and weights are stored column-wise, one list per field,
+        # so the training loop works on whole columns instead of node objects
+        self.fa = [3, -4, 5]
+        self.fb = [2, 1, -3]
+        self.fc = [1, 2, 1]
+        self.fs = [0b001, 0b010, 0b100]
+        self.fm = [1, 1, 1]
+
+        self.wa = [1, -1, 2]
+        self.wb = [1, 1, -1]
+        self.wc = [1, 2, 1]
+        self.ws = [0b000, 0b001, 0b010]
+        self.wm = [1, 1, 1]
 
         self.learning_rate = 0.05
         self.momentum = 0.9
-        # Initialize velocity for momentum as zero QuantumNumberV8 instances matching weights
-        self.velocity = [QuantumNumberV8() for _ in self.weights]
-
-    def multiply_feature_weight(self, feature, weight):
-        # Element-wise multiply a,b,c terms and combine signs and metadata
-        result = QuantumNumberV8()
-        result.a = feature.a * weight.a
-        result.b = feature.b * weight.b
-        result.c = feature.c * weight.c
-        result.signs = feature.signs | weight.signs
-        result.metadata = max(feature.metadata, weight.metadata)
-        return result
+        self.verbose = False  # print every weight update in gradient_step
+        # Initialize velocity for momentum as zero columns matching weights
+        self.va = [0] * len(self.wa)
+        self.vb = [0] * len(self.wb)
+        self.vc = [0] * len(self.wc)
 
     def weighted_sum(self):
         # Weighted sum of features * weights on a,b,c terms with combined signs and metadata
         total = QuantumNumberV8()
-        total.a = 0
-        total.b = 0
-        total.c = 0
-        total.signs = 0
-        total.metadata = 0
-        for f, w in zip(self.features, self.weights):
-            mul = self.multiply_feature_weight(f, w)
-            total.a += mul.a
-            total.b += mul.b
-            total.c += mul.c
-            total.signs |= mul.signs
-            total.metadata = max(total.metadata, mul.metadata)
+        total.a, total.b, total.c, total.signs, total.metadata = _weighted_sum(
+            self.fa, self.fb, self.fc, self.wa, self.wb, self.wc,
+            self.fs, self.ws, self.fm, self.wm)
         return total
 
     def relu_activation(self, qnum):
         # Simple ReLU on terms a,b,c and adjust signs accordingly
-        for term in ['a', 'b', 'c']:
+        cleared = 0
+        for term, bit in _ABC_BITS:
             val = getattr(qnum, term)
-            if val < 0:
-                setattr(qnum, term, 0)
-                # Clear any sign bit related to this term (just example: bit 0 for 'a', 1 for 'b', 2 for 'c')
-                qnum.signs &= ~(1 << ['a','b','c'].index(term))
+            neg = val < 0
+            setattr(qnum, term, 0 if neg else val)
+            # Collect the sign bit related to this term (bit 0 for 'a', 1 for 'b', 2 for 'c');
+            # neg is a bool, so nothing is collected when the term is non-negative
+            cleared |= neg << bit
+        qnum.signs &= ~cleared
         qnum.metadata += 1  # Track activation applied
         return qnum
 
     def gradient_step(self, output, target):
         error = target - output.a  # Use 'a' term error for simplicity
-        print(f"\nGradient step, error = {error:.4f}")
-
-        for i, (f, w, v) in enumerate(zip(self.features, self.weights, self.velocity)):
-            # Calculate gradient for each term (a,b,c)
-            grad_a = error * f.a
-            grad_b = error * f.b
-            grad_c = error * f.c
+        if self.verbose:
+            print(f"\nGradient step, error = {error:.4f}")
 
-            # Momentum update
-            v.a = self.momentum * v.a + self.learning_rate * grad_a
-            v.b = self.momentum * v.b + self.learning_rate * grad_b
-            v.c = self.momentum * v.c + self.learning_rate * grad_c
+        lr = self.learning_rate
+        momentum = self.momentum
 
-            # Update weights
-            w.a += v.a
-            w.b += v.b
-            w.c += v.c
+        # Momentum update and weight update, one column per term (a,b,c)
+        self.wa[:], self.va[:] = _momentum_sgd(self.wa, self.va, self.fa, lr, momentum, error)
+        self.wb[:], self.vb[:] = _momentum_sgd(self.wb, self.vb, self.fb, lr, momentum, error)
+        self.wc[:], self.vc[:] = _momentum_sgd(self.wc, self.vc, self.fc, lr, momentum, error)
 
-            print(f"Weight[{i}] updated a={w.a:.4f}, b={w.b:.4f}, c={w.c:.4f}")
+        if self.verbose:
+            for i, (wa, wb, wc) in enumerate(zip(self.wa, self.wb, self.wc)):
+                print(f"Weight[{i}] updated a={wa:.4f}, b={wb:.4f}, c={wc:.4f}")
 
     def run(self):
         print("Initial features:")
@@ -143,4 +115,5 @@ class QuantumNumberV8Demo11:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo11()
+    demo.verbose = True
     demo.run()
@@ -1,6 +1,14 @@
 # QuantumNumberV8Demo12.py
 
+from functools import reduce
+from operator import mul, or_
+
+from QuantumNumberV8 import column_view, merged_metadata
+
 class QuantumNumberV8:
+    __slots__ = ('signs', 'metadata', 'a', 'b', 'c', 'd', 'e', 'f',
+                 'left', 'right', 'up', 'down', 'in_', 'out')
+
     def __init__(self):
         self.signs = 0
         self.metadata = 0
@@ -23,75 +31,47 @@ class QuantumNumberV8:
                 f"  left={self.left}, right={self.right}, up={self.up}, down={self.down},\n"
                 f"  in_={self.in_}, out={self.out})")
 
+def _weighted_sum(fa, wa, fs, ws, fm, wm):
+    # Column kernel: 'a' term, signs and metadata of sum(features * weights)
+    return (
+        sum(map(mul, fa, wa)),
+        reduce(or_, fs, 0) | reduce(or_, ws, 0),
+        merged_metadata(fm, wm),
+    )
+
+def _sgd(w, f, step):
+    # Column kernel: element-wise w + step * f
+    return [wi + step * fi for fi, wi in zip(f, w)]
+
 # Demo12 class implementing your example workflow
 class QuantumNumberV8Demo12:
+    # QuantumNumberV8 views of the feature and weight columns; writes through
+    # a row update the columns
+    features = column_view('f')
+    weights = column_view('w')
+
     def __init__(self):
-        # Initialize feature vectors
-        self.features = []
-
-        q0 = QuantumNumberV8()
-        q0.signs = 0b001
-        q0.a = 1
-        q0.b = 2
-        q0.c = 1
-        q0.metadata = 1
-        self.features.append(q0)
-
-        q1 = QuantumNumberV8()
-        q1.signs = 0b010
-        q1.a = -1
-        q1.b = 0
-        q1.c = 2
-        q1.metadata = 1
-        self.features.append(q1)
-
-        q2 = QuantumNumberV8()
-        q2.signs = 0b100
-        q2.a = 3
-        q2.b = -1
-        q2.c = 1
-        q2.metadata = 1
-        self.features.append(q2)
+        # Initialize feature vectors, stored column-wise (one list per field)
+        self.fa = [1, -1, 3]
+        self.fb = [2, 0, -1]
+        self.fc = [1, 2, 1]
+        self.fs = [0b001, 0b010, 0b100]
+        self.fm = [1, 1, 1]
 
         # Initialize weights similarly
-        self.weights = []
-
-        w0 = QuantumNumberV8()
-        w0.signs = 0b000
-        w0.a = 1
-        w0.b = 1
-        w0.c = 1
-        w0.metadata = 1
-        self.weights.append(w0)
-
-        w1 = QuantumNumberV8()
-        w1.signs = 0b001
-        w1.a = -1
-        w1.b = 1
-        w1.c = 2
-        w1.metadata = 1
-        self.weights.append(w1)
-
-        w2 = QuantumNumberV8()
-        w2.signs = 0b010
-        w2.a = 2
-        w2.b = -1
-        w2.c = 1
-        w2.metadata = 1
-        self.weights.append(w2)
+        self.wa = [1, -1, 2]
+        self.wb = [1, 1, -1]
+        self.wc = [1, 2, 1]
+        self.ws = [0b000, 0b001, 0b010]
+        self.wm = [1, 1, 1]
+
+        self.verbose = False  # print every weight update in gradient_step
 
     def weighted_sum(self):
         # Sum feature * weight (only on 'a' terms here, extend as needed)
         output = QuantumNumberV8()
-        output.signs = 0
-        output.metadata = 0
-        output.a = 0
-
-        for f, w in zip(self.features, self.weights):
-            output.a += f.a * w.a
-            output.signs |= (f.signs | w.signs)
-            output.metadata = max(output.metadata, f.metadata, w.metadata)
-
+        output.a, output.signs, output.metadata = _weighted_sum(
+            self.fa, self.wa, self.fs, self.ws, self.fm, self.wm)
         return output
 
     def relu_activation(self, qnum):
@@ -104,15 +84,18 @@ class QuantumNumberV8Demo12:
 
     def gradient_step(self, output, target):
         error = target - output.a
-        print(f"Gradient step, error = {error:.4f}")
+        if self.verbose:
+            print(f"Gradient step, error = {error:.4f}")
 
         # Update weights a,b,c by a fraction of error times corresponding feature terms
         learning_rate = 0.05
-        for i in range(len(self.weights)):
-            self.weights[i].a += learning_rate * error * self.features[i].a
-            self.weights[i].b += learning_rate * error * self.features[i].b
-            self.weights[i].c += learning_rate * error * self.features[i].c
-            print(f"Weight[{i}] updated a={self.weights[i].a:.4f}, b={self.weights[i].b:.4f}, c={self.weights[i].c:.4f}")
+        step = learning_rate * error
+        self.wa[:] = _sgd(self.wa, self.fa, step)
+        self.wb[:] = _sgd(self.wb, self.fb, step)
+        self.wc[:] = _sgd(self.wc, self.fc, step)
+        if self.verbose:
+            for i, (wa, wb, wc) in enumerate(zip(self.wa, self.wb, self.wc)):
+                print(f"Weight[{i}] updated a={wa:.4f}, b={wb:.4f}, c={wc:.4f}")
 
     def run(self):
         print("Initial features:")
@@ -140,4 +123,5 @@ class QuantumNumberV8Demo12:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo12()
+    demo.verbose = True
     demo.run()
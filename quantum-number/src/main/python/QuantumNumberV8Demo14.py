@@ -1,86 +1,57 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import reduce
+from operator import mul, or_
+
+from QuantumNumberV8 import QuantumNumberV8, column_view, merged_metadata
+
+# (term, sign bit) pairs handled by relu_activation
+_ABC_BITS = (('a', 0), ('b', 1), ('c', 2))
 
 class QuantumNumberV8Demo14:
+    # QuantumNumberV8 views of the feature and weight columns; writes through
+    # a row update the columns
+    features = column_view('f')
+    weights = column_view('w')
+
     def __init__(self):
-        self.features = []
-        self.weights = []
+        # Features and weights are stored column-wise, one list per field
 
         # Initialize features
-        q0 = QuantumNumberV8()
-        q0.signs = 1
-        q0.metadata = 1
-        q0.a = 2
-        q0.b = 1
-        q0.c = 0
-        self.features.append(q0)
-
-        q1 = QuantumNumberV8()
-        q1.signs = 2
-        q1.metadata = 1
-        q1.a = -1
-        q1.b = 3
-        q1.c = 1
-        self.features.append(q1)
-
-        q2 = QuantumNumberV8()
-        q2.signs = 4
-        q2.metadata = 1
-        q2.a = 4
-        q2.b = -2
-        q2.c = 2
-        self.features.append(q2)
+        self.fa = [2, -1, 4]
+        self.fb = [1, 3, -2]
+        self.fc = [0, 1, 2]
+        self.fs = [1, 2, 4]
+        self.fm = [1, 1, 1]
 
         # Initialize weights
-        w0 = QuantumNumberV8()
-        w0.signs = 0
-        w0.metadata = 1
-        w0.a = 0.5
-        w0.b = 1.0
-        w0.c = -0.5
-        self.weights.append(w0)
-
-        w1 = QuantumNumberV8()
-        w1.signs = 1
-        w1.metadata = 1
-        w1.a = -1.5
-        w1.b = 0.5
-        w1.c = 1.0
-        self.weights.append(w1)
-
-        w2 = QuantumNumberV8()
-        w2.signs = 2
-        w2.metadata = 1
-        w2.a = 2.0
-        w2.b = -1.0
-        w2.c = 0.5
-        self.weights.append(w2)
+        self.wa = [0.5, -1.5, 2.0]
+        self.wb = [1.0, 0.5, -1.0]
+        self.wc = [-0.5, 1.0, 0.5]
+        self.ws = [0, 1, 2]
+        self.wm = [1, 1, 1]
 
     def weighted_sum(self):
         output = QuantumNumberV8()
-        output.signs = 0
-        output.metadata = 0
-        output.a = 0
-        output.b = 0
-        output.c = 0
-
-        for f, w in zip(self.features, self.weights):
-            output.a += f.a * w.a
-            output.b += f.b * w.b
-            output.c += f.c * w.c
-            output.signs |= (f.signs | w.signs)
-            output.metadata = max(output.metadata, f.metadata, w.metadata)
-
+        output.a = sum(map(mul, self.fa, self.wa))
+        output.b = sum(map(mul, self.fb, self.wb))
+        output.c = sum(map(mul, self.fc, self.wc))
+        output.signs = reduce(or_, self.fs, 0) | reduce(or_, self.ws, 0)
+        output.metadata = merged_metadata(self.fm, self.wm)
         return output
 
     def relu_activation(self, qnum):
         # Apply ReLU individually to a,b,c terms
-        for attr in ['a','b','c']:
+        cleared = 0
+        negatives = 0
+        for attr, bit in _ABC_BITS:
             val = getattr(qnum, attr)
-            if val < 0:
-                setattr(qnum, attr, 0)
-                # Clear the bit for that attr in signs (assuming a=bit0, b=bit1, c=bit2)
-                qnum.signs &= ~(1 << ['a','b','c'].index(attr))
-                qnum.metadata += 1
+            neg = val < 0
+            setattr(qnum, attr, 0 if neg else val)
+            # Collect the bit for that attr in signs (assuming a=bit0, b=bit1, c=bit2);
+            # neg is a bool, so nothing changes when the term is non-negative
+            cleared |= neg << bit
+            negatives += neg
+        qnum.signs &= ~cleared
+        qnum.metadata += negatives
         return qnum
 
     def run(self):
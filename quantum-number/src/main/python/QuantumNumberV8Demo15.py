@@ -1,15 +1,18 @@
+from itertools import chain
+from operator import attrgetter
+
 from QuantumNumberV8 import QuantumNumberV8
 
 # Assuming QuantumNumberV8 class is defined as you provided above
 
+_coefficients = attrgetter('a', 'b', 'c', 'd', 'e', 'f')
+_neighbors = attrgetter('left', 'right', 'up', 'down', 'in_', 'out')
+
 def sum_all_coefficients(qnum):
     # Sum all coefficients of qnum and all connected pointers
-    nodes = [qnum, qnum.left, qnum.right, qnum.up, qnum.down, qnum.in_, qnum.out]
-    total = 0
-    for node in nodes:
-        if node:
-            total += node.a + node.b + node.c + node.d + node.e + node.f
-    return total
+    nodes = filter(None, (qnum, *_neighbors(qnum)))
+    # Single flat reduction over every coefficient of every present node
+    return sum(chain.from_iterable(map(_coefficients, nodes)))
 
 
 # Create main node
@@ -1,18 +1,35 @@
+from array import array
+from operator import sub
+
+from QuantumNumberV8 import coef_property
+
+def _ptr_id(ptr):
+    return hex(id(ptr)) if ptr else "None"
+
 class QuantumNumberV8:
     """
     QuantumNumberV8 from your definition.
     Simplified __init__ for demo, with optional initial values.
     """
 
+    __slots__ = ('signs', 'metadata', 'coef',
+                 'left', 'right', 'up', 'down', 'in_', 'out')
+
+    # Coefficients live in the contiguous coef list; a..f are named views
+    a = coef_property(0, 'a')
+    b = coef_property(1, 'b')
+    c = coef_property(2, 'c')
+    d = coef_property(3, 'd')
+    e = coef_property(4, 'e')
+    f = coef_property(5, 'f')
+
+    # Set to False on the class to drop the pointer ids from __repr__
+    full_repr = True
+
     def __init__(self, signs=0, metadata=0, a=0, b=0, c=0, d=0, e=0, f=0):
         self.signs = signs
         self.metadata = metadata
-        self.a = a
-        self.b = b
-        self.c = c
-        self.d = d
-        self.e = e
-        self.f = f
+        self.coef = [a, b, c, d, e, f]
 
         self.left = None
         self.right = None
@@ -22,38 +39,39 @@ class QuantumNumberV8:
         self.out = None
 
     def __repr__(self):
-        def ptr_id(ptr):
-            return hex(id(ptr)) if ptr else "None"
+        a, b, c, d, e, f = self.coef
+        if not self.full_repr:
+            return (f"QuantumNumberV8(signs={self.signs}, metadata={self.metadata}, "
+                    f"a={a}, b={b}, c={c}, d={d}, e={e}, f={f})")
         return (f"QuantumNumberV8(signs={self.signs}, metadata={self.metadata},\n"
-                f"  a={self.a}, b={self.b}, c={self.c}, d={self.d}, e={self.e}, f={self.f},\n"
-                f"  left={ptr_id(self.left)}, right={ptr_id(self.right)}, up={ptr_id(self.up)}, down={ptr_id(self.down)},\n"
-                f"  in_={ptr_id(self.in_)}, out={ptr_id(self.out)})")
+                f"  a={a}, b={b}, c={c}, d={d}, e={e}, f={f},\n"
+                f"  left={_ptr_id(self.left)}, right={_ptr_id(self.right)}, up={_ptr_id(self.up)}, down={_ptr_id(self.down)},\n"
+                f"  in_={_ptr_id(self.in_)}, out={_ptr_id(self.out)})")
 
     def copy(self):
-        return QuantumNumberV8(self.signs, self.metadata, self.a, self.b, self.c, self.d, self.e, self.f)
+        q = type(self)()
+        q.signs = self.signs
+        q.metadata = self.metadata
+        q.coef[:] = self.coef
+        return q
 
     def add(self, other):
         """Elementwise add coefficients a-f"""
-        self.a += other.a
-        self.b += other.b
-        self.c += other.c
-        self.d += other.d
-        self.e += other.e
-        self.f += other.f
+        coef = self.coef
+        for i, v in enumerate(other.coef):
+            coef[i] += v
 
     def multiply_scalar(self, scalar):
         """Multiply all coefficients by scalar"""
-        self.a *= scalar
-        self.b *= scalar
-        self.c *= scalar
-        self.d *= scalar
-        self.e *= scalar
-        self.f *= scalar
+        coef = self.coef
+        for i, v in enumerate(coef):
+            coef[i] = v * scalar
 
     def relu(self):
         """Apply ReLU on 'a' coeff only for simplicity"""
-        if self.a < 0:
-            self.a = 0
+        coef = self.coef
+        if coef[0] < 0:
+            coef[0] = 0
 
     def weighted_sum_neighbors(self):
         """Sum self + neighbors (up, down, left, right) elementwise"""
@@ -63,78 +81,139 @@ class QuantumNumberV8:
                 result.add(neighbor)
         return result
 
+class QuantumNumberV8F64(QuantumNumberV8):
+    """QuantumNumberV8 with coefficients held as 64-bit floats in a compact array('d')"""
+
+    __slots__ = ()
+
+    def __init__(self, signs=0, metadata=0, a=0, b=0, c=0, d=0, e=0, f=0):
+        super().__init__(signs, metadata, a, b, c, d, e, f)
+        self.coef = array('d', self.coef)
+
 class QuantumNumberV8Demo17:
     def __init__(self):
         self.grid_size = 3
         self.learning_rate = 0.01
+        self.verbose = False  # print each phase of every training step
         self.nodes = []
-        self.weights = []
-        self.targets = []
 
-        # Create grid nodes and weights
-        for i in range(self.grid_size ** 2):
+        # Create grid nodes
+        num_nodes = self.grid_size ** 2
+        for i in range(num_nodes):
             node = QuantumNumberV8(a=i+1)  # Node's initial 'a' increases 1..9
-            weight = QuantumNumberV8(a=1.0)  # Init weights to 1.0
             self.nodes.append(node)
-            self.weights.append(weight)
-            self.targets.append(5.0)  # Target output for each node, arbitrary 5.0
-
-        # Link nodes up/down/left/right in 3x3 grid
-        for r in range(self.grid_size):
-            for c in range(self.grid_size):
-                idx = r * self.grid_size + c
-                node = self.nodes[idx]
-                # left neighbor
-                if c > 0:
-                    node.left = self.nodes[idx - 1]
-                # right neighbor
-                if c < self.grid_size - 1:
-                    node.right = self.nodes[idx + 1]
-                # up neighbor
-                if r > 0:
-                    node.up = self.nodes[idx - self.grid_size]
-                # down neighbor
-                if r < self.grid_size - 1:
-                    node.down = self.nodes[idx + self.grid_size]
+
+        # Per-node scalar weights, targets and 'a' outputs, built once as flat lists
+        self.weights_a = [1.0] * num_nodes  # Init weights to 1.0
+        self.targets = [5.0] * num_nodes  # Target output for each node, arbitrary 5.0
+        self.output_a = [0.0] * num_nodes
+
+        # Neighbor indices from grid arithmetic, -1 at the grid edge
+        n = self.grid_size
+        cells = range(num_nodes)
+        up = [i - n if i >= n else -1 for i in cells]
+        down = [i + n if i < num_nodes - n else -1 for i in cells]
+        left = [i - 1 if i % n else -1 for i in cells]
+        right = [i + 1 if (i + 1) % n else -1 for i in cells]
+
+        # Link nodes up/down/left/right in 3x3 grid; index -1 picks the trailing None
+        padded = self.nodes + [None]
+        for node, u, d, l, r in zip(self.nodes, up, down, left, right):
+            node.up = padded[u]
+            node.down = padded[d]
+            node.left = padded[l]
+            node.right = padded[r]
+
+        # Flat adjacency table: for each node, the indices of itself and its
+        # up/down/left/right neighbors
+        self.neighbors = [tuple(j for j in stencil if j >= 0)
+                          for stencil in zip(cells, up, down, left, right)]
+
+        # Scratch state reused by every training step: the unweighted
+        # neighbor sums, output nodes and error list are overwritten in place
+        self._nbr_sum = [[0.0] * 6 for _ in range(num_nodes)]
+        self.outputs = [QuantumNumberV8F64() for _ in range(num_nodes)]
+        self.errors = [0.0] * num_nodes
+
+    def _refresh_neighbor_sums(self):
+        """Sum each node's coefficients with those of its grid neighbors"""
+        # The index table is static; the coefficients are read from the live
+        # nodes at the start of every pass, so edits to node values take
+        # effect on the next step
+        nodes = self.nodes
+        for total, stencil in zip(self._nbr_sum, self.neighbors):
+            for k in range(6):
+                total[k] = 0.0
+            for j in stencil:
+                for k, v in enumerate(nodes[j].coef):
+                    total[k] += v
+
+    def _node_output(self, idx):
+        """Write the weighted, ReLU-activated neighbor sum of node idx into its output node"""
+        w = self.weights_a[idx]  # simple scalar weight
+        weighted_output = self.outputs[idx]
+        coef = weighted_output.coef
+        for k, v in enumerate(self._nbr_sum[idx]):
+            coef[k] = v * w
+        # Apply ReLU
+        weighted_output.relu()
+        return weighted_output
 
     def forward(self):
-        print("\n--- Forward Pass ---")
-        self.outputs = []
-        for idx, node in enumerate(self.nodes):
-            # Weighted sum neighbors and self
-            neighbor_sum = node.weighted_sum_neighbors()
-            # Multiply by weight
-            w = self.weights[idx]
-            weighted_output = neighbor_sum.copy()
-            weighted_output.multiply_scalar(w.a)  # simple scalar weight
-            # Apply ReLU
-            weighted_output.relu()
-            self.outputs.append(weighted_output)
-            print(f"Node[{idx}] weighted output a={weighted_output.a:.4f}")
+        if self.verbose:
+            print("\n--- Forward Pass ---")
+        self._refresh_neighbor_sums()
+        output_a = self.output_a
+        for idx in range(len(self.nodes)):
+            weighted_output = self._node_output(idx)
+            output_a[idx] = weighted_output.a
+            if self.verbose:
+                print(f"Node[{idx}] weighted output a={weighted_output.a:.4f}")
 
     def backward(self):
-        print("\n--- Backward Pass ---")
-        self.errors = []
-        for idx, output in enumerate(self.outputs):
-            error = self.targets[idx] - output.a
-            self.errors.append(error)
-            print(f"Node[{idx}] error = {error:.4f}")
+        self.errors[:] = map(sub, self.targets, self.output_a)
+        if self.verbose:
+            print("\n--- Backward Pass ---")
+            for idx, error in enumerate(self.errors):
+                print(f"Node[{idx}] error = {error:.4f}")
 
     def update_weights(self):
-        print("\n--- Weight Update ---")
+        # dLoss/dOutput simplified: the gradient is the error itself
+        weights_a = self.weights_a
+        old_weights = weights_a[:] if self.verbose else None
+        learning_rate = self.learning_rate
         for idx, error in enumerate(self.errors):
-            gradient = error  # dLoss/dOutput simplified
-            old_weight = self.weights[idx].a
-            self.weights[idx].a += self.learning_rate * gradient
-            print(f"Weight[{idx}] updated: {old_weight:.4f} -> {self.weights[idx].a:.4f}")
+            weights_a[idx] += learning_rate * error
+        if self.verbose:
+            print("\n--- Weight Update ---")
+            for idx, (old_weight, new_weight) in enumerate(zip(old_weights, weights_a)):
+                print(f"Weight[{idx}] updated: {old_weight:.4f} -> {new_weight:.4f}")
 
     def train_step(self):
-        self.forward()
-        self.backward()
-        self.update_weights()
+        if self.verbose:
+            # Run the phases separately so each one can be reported
+            self.forward()
+            self.backward()
+            self.update_weights()
+            return
+
+        # Fused forward/backward/update: a node's output only depends on its
+        # own weight, so a single pass over the nodes gives the same result
+        self._refresh_neighbor_sums()
+        learning_rate = self.learning_rate
+        weights_a = self.weights_a
+        output_a = self.output_a
+        errors = self.errors
+        for idx, target in enumerate(self.targets):
+            output = self._node_output(idx)
+            error = target - output.a
+            weights_a[idx] += learning_rate * error
+            output_a[idx] = output.a
+            errors[idx] = error
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo17()
+    demo.verbose = True
     # Run 5 training steps
     for step in range(5):
         print(f"\n=== Training Step {step + 1} ===")
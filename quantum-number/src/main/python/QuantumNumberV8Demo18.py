@@ -1,18 +1,29 @@
+from array import array
+from operator import mul, sub
+
+from QuantumNumberV8 import coef_property
+
 class QuantumNumberV8:
     """
     QuantumNumberV8 from your definition.
     Simplified __init__ for demo, with optional initial values.
     """
 
+    __slots__ = ('signs', 'metadata', 'coef',
+                 'left', 'right', 'up', 'down', 'in_', 'out')
+
+    # Coefficients live in one array('d') of six floats; a..f are named views
+    a = coef_property(0, 'a')
+    b = coef_property(1, 'b')
+    c = coef_property(2, 'c')
+    d = coef_property(3, 'd')
+    e = coef_property(4, 'e')
+    f = coef_property(5, 'f')
+
     def __init__(self, signs=0, metadata=0, a=0, b=0, c=0, d=0, e=0, f=0):
         self.signs = signs
         self.metadata = metadata
-        self.a = a
-        self.b = b
-        self.c = c
-        self.d = d
-        self.e = e
-        self.f = f
+        self.coef = array('d', (a, b, c, d, e, f))
 
         self.left = None
         self.right = None
@@ -24,52 +35,69 @@ class QuantumNumberV8:
     def __repr__(self):
         def ptr_id(ptr):
             return hex(id(ptr)) if ptr else "None"
+        a, b, c, d, e, f = self.coef
         return (f"QuantumNumberV8(signs={self.signs}, metadata={self.metadata},\n"
-                f"  a={self.a}, b={self.b}, c={self.c}, d={self.d}, e={self.e}, f={self.f},\n"
+                f"  a={a}, b={b}, c={c}, d={d}, e={e}, f={f},\n"
                 f"  left={ptr_id(self.left)}, right={ptr_id(self.right)}, up={ptr_id(self.up)}, down={ptr_id(self.down)},\n"
                 f"  in_={ptr_id(self.in_)}, out={ptr_id(self.out)})")
 
     def copy(self):
-        return QuantumNumberV8(self.signs, self.metadata, self.a, self.b, self.c, self.d, self.e, self.f)
+        return QuantumNumberV8(self.signs, self.metadata, *self.coef)
 
     def add(self, other):
         """Elementwise add coefficients a-f"""
-        self.a += other.a
-        self.b += other.b
-        self.c += other.c
-        self.d += other.d
-        self.e += other.e
-        self.f += other.f
+        coef = self.coef
+        for i, v in enumerate(other.coef):
+            coef[i] += v
 
     def multiply_scalar(self, scalar):
         """Multiply all coefficients by scalar"""
-        self.a *= scalar
-        self.b *= scalar
-        self.c *= scalar
-        self.d *= scalar
-        self.e *= scalar
-        self.f *= scalar
+        coef = self.coef
+        for i, v in enumerate(coef):
+            coef[i] = v * scalar
 
     def relu(self):
         """Apply ReLU on 'a' coeff only for simplicity"""
-        if self.a < 0:
-            self.a = 0
-
-    def weighted_sum_neighbors(self):
-        """Sum self + neighbors (up, down, left, right) elementwise"""
-        result = self.copy()
-        for neighbor in [self.up, self.down, self.left, self.right]:
-            if neighbor:
-                result.add(neighbor)
-        return result
+        coef = self.coef
+        if coef[0] < 0:
+            coef[0] = 0
+
+def build_csr(grid_size):
+    """Build the up/down/left/right neighbor lists of a square grid in CSR form"""
+    # Neighbors of node i are indices[indptr[i]:indptr[i + 1]]
+    n = grid_size
+    num_nodes = n * n
+    indptr = array('i', [0])
+    indices = array('i')
+    for i in range(num_nodes):
+        if i >= n:
+            indices.append(i - n)
+        if i < num_nodes - n:
+            indices.append(i + n)
+        if i % n:
+            indices.append(i - 1)
+        if (i + 1) % n:
+            indices.append(i + 1)
+        indptr.append(len(indices))
+    return indptr, indices
+
+def weighted_sum_neighbors(nodes, indptr, indices, out):
+    """Write each node's coefficients plus those of its CSR neighbors into out, row by row"""
+    start = indptr[0]
+    for i, total in enumerate(out):
+        total[:] = nodes[i].coef
+        stop = indptr[i + 1]
+        for p in range(start, stop):
+            for k, v in enumerate(nodes[indices[p]].coef):
+                total[k] += v
+        start = stop
 
 class QuantumNumberV8Demo18:
     def __init__(self):
         self.grid_size = 3
         self.learning_rate = 0.001
+        self.verbose = False  # print each phase of every training step
         self.nodes = []
-        self.weights = []
-        self.targets = []
 
         # Initialize nodes with increasing coefficients for demo
         for i in range(self.grid_size ** 2):
@@ -78,95 +106,95 @@ class QuantumNumberV8Demo18:
                 a=i+1, b=(i+1)*2, c=(i+1)*3,
                 d=(i+1)*4, e=(i+1)*5, f=(i+1)*6
             )
-            # weights initialized all 1.0 for demo
-            weight = QuantumNumberV8(a=1.0, b=1.0, c=1.0, d=1.0, e=1.0, f=1.0)
             self.nodes.append(node)
-            self.weights.append(weight)
-            # targets set to fixed QuantumNumber with all coefficients = 10.0
-            self.targets.append(QuantumNumberV8(a=10, b=10, c=10, d=10, e=10, f=10))
-
-        # Link neighbors in grid (up/down/left/right)
-        for r in range(self.grid_size):
-            for c in range(self.grid_size):
-                idx = r * self.grid_size + c
-                node = self.nodes[idx]
-                if c > 0:
-                    node.left = self.nodes[idx - 1]
-                if c < self.grid_size - 1:
-                    node.right = self.nodes[idx + 1]
-                if r > 0:
-                    node.up = self.nodes[idx - self.grid_size]
-                if r < self.grid_size - 1:
-                    node.down = self.nodes[idx + self.grid_size]
+
+        # Training state is stored as rows of six coefficients (a-f) per node:
+        # weights (all 1.0 for demo, diverging as they train); every node
+        # shares the one target row (all 10)
+        num_nodes = len(self.nodes)
+        self.weights = [[1.0] * 6 for _ in range(num_nodes)]
+        self.target = [10] * 6
+
+        # Grid adjacency as a CSR edge list built once, in place of
+        # up/down/left/right links between the nodes
+        self.indptr, self.indices = build_csr(self.grid_size)
+
+        # Neighbor sums, outputs and errors are buffers reused every step;
+        # the neighbor sums are refilled from the nodes once per pass
+        self._nbr_sum = [[0.0] * 6 for _ in range(num_nodes)]
+        self.outputs = [[0.0] * 6 for _ in range(num_nodes)]
+        self.errors = [[0.0] * 6 for _ in range(num_nodes)]
+
+    def _refresh_neighbor_sums(self):
+        # Read the node coefficients at the start of every pass, so edits to
+        # self.nodes take effect on the next step
+        weighted_sum_neighbors(self.nodes, self.indptr, self.indices, self._nbr_sum)
 
     def forward(self):
-        print("\n--- Forward Pass ---")
-        self.outputs = []
-        for idx, node in enumerate(self.nodes):
-            # Sum neighbors + self coefficients
-            summed = node.weighted_sum_neighbors()
-            # Multiply each coefficient by corresponding weight coeff
-            w = self.weights[idx]
-            out = QuantumNumberV8(
-                a=summed.a * w.a,
-                b=summed.b * w.b,
-                c=summed.c * w.c,
-                d=summed.d * w.d,
-                e=summed.e * w.e,
-                f=summed.f * w.f
-            )
+        if self.verbose:
+            print("\n--- Forward Pass ---")
+        self._refresh_neighbor_sums()
+        for idx, (summed, w, out) in enumerate(zip(self._nbr_sum, self.weights, self.outputs)):
+            # Multiply each summed coefficient by corresponding weight coeff
+            out[:] = map(mul, summed, w)
             # ReLU only on 'a' for now
-            if out.a < 0:
-                out.a = 0
-            self.outputs.append(out)
-            print(f"Node[{idx}] output: a={out.a:.3f}, b={out.b:.3f}, c={out.c:.3f}, "
-                  f"d={out.d:.3f}, e={out.e:.3f}, f={out.f:.3f}")
+            if out[0] < 0:
+                out[0] = 0
+            if self.verbose:
+                print("Node[{}] output: a={:.3f}, b={:.3f}, c={:.3f}, "
+                      "d={:.3f}, e={:.3f}, f={:.3f}".format(idx, *out))
 
     def backward(self):
-        print("\n--- Backward Pass ---")
-        self.errors = []
-        for idx, (output, target) in enumerate(zip(self.outputs, self.targets)):
+        if self.verbose:
+            print("\n--- Backward Pass ---")
+        target = self.target
+        for idx, (output, err) in enumerate(zip(self.outputs, self.errors)):
             # Compute error per coefficient (target - output)
-            err = QuantumNumberV8(
-                a=target.a - output.a,
-                b=target.b - output.b,
-                c=target.c - output.c,
-                d=target.d - output.d,
-                e=target.e - output.e,
-                f=target.f - output.f,
-            )
-            self.errors.append(err)
-            print(f"Node[{idx}] error: a={err.a:.3f}, b={err.b:.3f}, c={err.c:.3f}, "
-                  f"d={err.d:.3f}, e={err.e:.3f}, f={err.f:.3f}")
+            err[:] = map(sub, target, output)
+            if self.verbose:
+                print("Node[{}] error: a={:.3f}, b={:.3f}, c={:.3f}, "
+                      "d={:.3f}, e={:.3f}, f={:.3f}".format(idx, *err))
 
     def update_weights(self):
-        print("\n--- Weights Update ---")
-        for idx, err in enumerate(self.errors):
-            w = self.weights[idx]
-            old = (w.a, w.b, w.c, w.d, w.e, w.f)
-            # Gradient descent weight update per coefficient
-            w.a += self.learning_rate * err.a
-            w.b += self.learning_rate * err.b
-            w.c += self.learning_rate * err.c
-            w.d += self.learning_rate * err.d
-            w.e += self.learning_rate * err.e
-            w.f += self.learning_rate * err.f
-            print(f"Weight[{idx}] update: "
-                  f"a {old[0]:.3f}->{w.a:.3f}, "
-                  f"b {old[1]:.3f}->{w.b:.3f}, "
-                  f"c {old[2]:.3f}->{w.c:.3f}, "
-                  f"d {old[3]:.3f}->{w.d:.3f}, "
-                  f"e {old[4]:.3f}->{w.e:.3f}, "
-                  f"f {old[5]:.3f}->{w.f:.3f}")
+        if self.verbose:
+            print("\n--- Weights Update ---")
+        lr = self.learning_rate
+        for idx, (w, err) in enumerate(zip(self.weights, self.errors)):
+            old = w[:] if self.verbose else None
+            # Gradient descent weight update per coefficient, in place
+            for k, ek in enumerate(err):
+                w[k] += lr * ek
+            if self.verbose:
+                print(f"Weight[{idx}] update: " + ", ".join(
+                    f"{k} {o:.3f}->{v:.3f}" for k, o, v in zip("abcdef", old, w)))
 
     def train_step(self):
-        self.forward()
-        self.backward()
-        self.update_weights()
+        if self.verbose:
+            # Run the phases separately so each one can be reported
+            self.forward()
+            self.backward()
+            self.update_weights()
+            return
+
+        # Fused forward/backward/update: each node's output only depends on
+        # its own weights, so one pass per node writes output, error and the
+        # new weights without going back over the whole grid in between
+        self._refresh_neighbor_sums()
+        lr = self.learning_rate
+        target = self.target
+        for summed, w, out, err in zip(self._nbr_sum, self.weights, self.outputs, self.errors):
+            for k in range(6):
+                o = summed[k] * w[k]
+                if k == 0 and o < 0:
+                    o = 0
+                out[k] = o
+                err[k] = e = target[k] - o
+                w[k] += lr * e
 
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo18()
+    demo.verbose = True
     for step in range(3):
         print(f"\n=== Training Step {step + 1} ===")
         demo.train_step()
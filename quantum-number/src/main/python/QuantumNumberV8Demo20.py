@@ -1,58 +1,79 @@
+# Coefficient names, in the order of every six-entry row
+_KEYS = ('a', 'b', 'c', 'd', 'e', 'f')
+
 def format_int(n):
     # Just print integer with commas for readability
     return f"{n:,}"
 
+def format_row(row):
+    # "a=..., b=..., ..." for one row of six integers
+    return ", ".join(f"{k}={format_int(v)}" for k, v in zip(_KEYS, row))
+
+def _forward_row(vals, weights):
+    # Forward kernel for one row: multiply quantum numbers by weights and
+    # divide by 1000 (to simulate scaling), integer math only
+    return [(v * w) // 1000 for v, w in zip(vals, weights)]
+
+def _update_row(weights, error):
+    # Update kernel for one row: subtract error // 10 (scaled adjustment) with
+    # integer arithmetic, in place; weights are clipped so they never go below 1
+    weights[:] = [max(1, w - err // 10) for w, err in zip(weights, error)]
+
 class QuantumNumberV8:
     def __init__(self, index, a, b, c, d, e, f):
         # Quantum numbers are integers only
         self.index = index
-        self.a = int(a)
-        self.b = int(b)
-        self.c = int(c)
-        self.d = int(d)
-        self.e = int(e)
-        self.f = int(f)
+        # Values, weights and errors are fixed-size lists ordered a-f
+        self.vals = [int(a), int(b), int(c), int(d), int(e), int(f)]
         # Initialize weights as integers (scaled by 1000 for example)
-        self.weights = {
-            'a': 1000,
-            'b': 1000,
-            'c': 1000,
-            'd': 1000,
-            'e': 1000,
-            'f': 1000
-        }
-        self.error = {k: 0 for k in self.weights}
+        self.weights = [1000] * 6
+        self.error = [0] * 6
 
     def forward(self):
         # Forward pass: output quantum numbers multiplied by weights, integer math only
-        output = {}
-        for k in ['a','b','c','d','e','f']:
-            # multiply quantum number by weight and divide by 1000 (to simulate scaling)
-            output[k] = (getattr(self, k) * self.weights[k]) // 1000
-        return output
+        return _forward_row(self.vals, self.weights)
 
     def backward(self, errors):
         # Backward pass: simple error propagation, just store errors here
-        self.error = errors
+        self.error[:] = errors
 
     def update_weights(self):
         # Update weights based on error, weights stay integers
-        # For simplicity, subtract error // 10 (scaled adjustment)
-        for k in self.weights:
-            # Update weight with integer arithmetic and clip >0
-            new_weight = self.weights[k] - self.error[k] // 10
-            self.weights[k] = max(1, new_weight)  # weights never below 1
+        _update_row(self.weights, self.error)
 
     def print_state(self, output):
-        print(f"QuantumNumberV8[{self.index}] output: " + ", ".join(
-            f"{k}={format_int(output[k])}" for k in output
-        ))
-        print(f"QuantumNumberV8[{self.index}] weights: " + ", ".join(
-            f"{k}={format_int(self.weights[k])}" for k in self.weights
-        ))
-        print(f"QuantumNumberV8[{self.index}] error: " + ", ".join(
-            f"{k}={format_int(self.error[k])}" for k in self.error
-        ))
+        print(f"QuantumNumberV8[{self.index}] output: " + format_row(output))
+        print(f"QuantumNumberV8[{self.index}] weights: " + format_row(self.weights))
+        print(f"QuantumNumberV8[{self.index}] error: " + format_row(self.error))
+
+
+class QuantumBatch:
+    """
+    Demo 20's instances stepped together: the caller passes one error row
+    per instance to backward(), and each step runs the per-row kernels over
+    the instances' own vals/weights/error lists, so print_state() on an
+    instance shows the batch's results.
+    """
+
+    def __init__(self, quantum_numbers):
+        self.vals = [qn.vals for qn in quantum_numbers]
+        self.weights = [qn.weights for qn in quantum_numbers]
+        self.error = [qn.error for qn in quantum_numbers]
+
+    def forward(self):
+        # Forward pass for the whole batch: one output row per instance
+        return [_forward_row(vals, weights) for vals, weights in zip(self.vals, self.weights)]
+
+    def backward(self, errors):
+        # Store one error row per instance
+        for row, err in zip(self.error, errors):
+            row[:] = err
+
+    def update_weights(self):
+        # Same integer update as QuantumNumberV8.update_weights, for every row
+        for weights, error in zip(self.weights, self.error):
+            _update_row(weights, error)
+
 
 def demo20():
     print("=== Demo 20: Integer Quantum Numbers with explicit powers of 10 ===\n")
@@ -63,6 +84,7 @@ def demo20():
         QuantumNumberV8(1, a=11, b=22, c=33, d=1, e=10_000_000_000, f=1),
         QuantumNumberV8(2, a=13, b=26, c=39, d=1, e=1, f=1_000_000_000),
     ]
+    batch = QuantumBatch(quantum_numbers)
 
     # Run 3 training steps
     for step in range(1,4):
@@ -70,30 +92,28 @@ def demo20():
 
         # Forward pass
         print("--- Forward Pass ---")
-        outputs = []
-        for qn in quantum_numbers:
-            out = qn.forward()
+        outputs = batch.forward()
+        for qn, out in zip(quantum_numbers, outputs):
             qn.print_state(out)
-            outputs.append(out)
             print()
 
         # Dummy errors: difference from some target (simulate)
         print("--- Backward Pass ---")
-        for qn in quantum_numbers:
-            # Create dummy error for demo: error = quantum numbers * -step (arbitrary)
-            error = {k: -(getattr(qn, k) * step * 10) for k in qn.weights}
-            qn.backward(error)
-            print(f"QuantumNumberV8[{qn.index}] error: " + ", ".join(f"{k}={format_int(error[k])}" for k in error))
+        # Create dummy error for demo: error = quantum numbers * -step (arbitrary)
+        errors = [[-(v * step * 10) for v in vals] for vals in batch.vals]
+        batch.backward(errors)
+        for qn, error in zip(quantum_numbers, errors):
+            print(f"QuantumNumberV8[{qn.index}] error: " + format_row(error))
         print()
 
         # Update weights
         print("--- Weights Update ---")
-        for qn in quantum_numbers:
-            before = qn.weights.copy()
-            qn.update_weights()
+        before = [weights.copy() for weights in batch.weights]
+        batch.update_weights()
+        for qn, old_weights in zip(quantum_numbers, before):
             print(f"QuantumNumberV8[{qn.index}] weights update:")
-            for k in qn.weights:
-                print(f"  {k}: {format_int(before[k])} -> {format_int(qn.weights[k])}")
+            for k, old, new in zip(_KEYS, old_weights, qn.weights):
+                print(f"  {k}: {format_int(old)} -> {format_int(new)}")
         print()
 
 if __name__ == "__main__":
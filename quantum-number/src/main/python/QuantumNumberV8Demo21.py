@@ -1,46 +1,76 @@
+# Coefficient names, in the order of every six-entry row
+_KEYS = ('a', 'b', 'c', 'd', 'e', 'f')
+
 def format_int(n):
     return f"{n:,}"
 
+def format_row(row):
+    # "a=..., b=..., ..." for one row of six integers
+    return ", ".join(f"{k}={format_int(v)}" for k, v in zip(_KEYS, row))
+
+def _forward_row(vals, weights):
+    # Forward kernel: one scaled integer output row
+    return [(val * w) // 1000 for val, w in zip(vals, weights)]
+
+def _backward_row(error, vals, step):
+    # Simulate error proportional to quantum numbers and step, scaled by 10
+    error[:] = [-(val * step * 10) for val in vals]
+
+def _update_row(weights, error):
+    # Update weights by subtracting error//20 to slow growth, weights ≥ 1
+    weights[:] = [max(1, w - (err // 20)) for w, err in zip(weights, error)]
+
 class QuantumNumberV8:
     def __init__(self, index, a, b, c, d, e, f):
         self.index = index
-        self.a = int(a)
-        self.b = int(b)
-        self.c = int(c)
-        self.d = int(d)
-        self.e = int(e)
-        self.f = int(f)
+        # Values, weights and errors are fixed-size lists ordered a-f
+        self.vals = [int(a), int(b), int(c), int(d), int(e), int(f)]
 
         # Initialize weights scaled by 1000 (integer math)
-        self.weights = {k: 1000 for k in ['a','b','c','d','e','f']}
-        self.error = {k: 0 for k in self.weights}
+        self.weights = [1000] * 6
+        self.error = [0] * 6
 
     def forward(self):
-        output = {}
-        for k in ['a','b','c','d','e','f']:
-            val = getattr(self, k)
-            output[k] = (val * self.weights[k]) // 1000
-        return output
+        return _forward_row(self.vals, self.weights)
 
     def backward(self, step):
-        # Simulate error proportional to quantum numbers and step, scaled by 10
-        self.error = {k: -(getattr(self, k) * step * 10) for k in self.weights}
+        _backward_row(self.error, self.vals, step)
 
     def update_weights(self):
-        # Update weights by subtracting error//20 to slow growth, weights ≥ 1
-        for k in self.weights:
-            new_w = self.weights[k] - (self.error[k] // 20)
-            self.weights[k] = max(1, new_w)
+        _update_row(self.weights, self.error)
 
     def print_state(self, output):
         print(f"QuantumNumberV8[{self.index}] output:")
-        print(", ".join(f"{k}={format_int(output[k])}" for k in output))
+        print(format_row(output))
         print("Weights:")
-        print(", ".join(f"{k}={format_int(self.weights[k])}" for k in self.weights))
+        print(format_row(self.weights))
         print("Error:")
-        print(", ".join(f"{k}={format_int(self.error[k])}" for k in self.error))
+        print(format_row(self.error))
         print()
 
+class QuantumBatch:
+    """
+    All Demo 21 instances advanced one step at a time. The error of every
+    row is simulated from its values and the step number, and each kernel
+    writes into the instance's own lists.
+    """
+
+    def __init__(self, quantum_numbers):
+        self.vals = [qn.vals for qn in quantum_numbers]
+        self.weights = [qn.weights for qn in quantum_numbers]
+        self.error = [qn.error for qn in quantum_numbers]
+
+    def forward(self):
+        return [_forward_row(vals, weights) for vals, weights in zip(self.vals, self.weights)]
+
+    def backward(self, step):
+        for error, vals in zip(self.error, self.vals):
+            _backward_row(error, vals, step)
+
+    def update_weights(self):
+        for weights, error in zip(self.weights, self.error):
+            _update_row(weights, error)
+
 def demo21():
     print("=== Demo 21: Integer Quantum Numbers & Scaled Weights with Controlled Updates ===\n")
 
@@ -50,35 +80,34 @@ def demo21():
         QuantumNumberV8(1, a=7, b=14, c=21, d=1, e=10_000_000_000, f=1),
         QuantumNumberV8(2, a=9, b=18, c=27, d=1, e=1, f=1_000_000_000),
     ]
+    batch = QuantumBatch(quantum_numbers)
 
     steps = 5
     for step in range(1, steps+1):
         print(f"=== Step {step} ===")
 
         print("Forward pass:")
-        for qn in quantum_numbers:
-            out = qn.forward()
+        for qn, out in zip(quantum_numbers, batch.forward()):
             qn.print_state(out)
 
         print("Backward pass (calculating errors):")
+        batch.backward(step)
         for qn in quantum_numbers:
-            qn.backward(step)
             print(f"QuantumNumberV8[{qn.index}] error:")
-            print(", ".join(f"{k}={format_int(qn.error[k])}" for k in qn.error))
+            print(format_row(qn.error))
         print()
 
         print("Updating weights:")
-        for qn in quantum_numbers:
-            before = qn.weights.copy()
-            qn.update_weights()
+        before = [weights.copy() for weights in batch.weights]
+        batch.update_weights()
+        for qn, old_weights in zip(quantum_numbers, before):
             print(f"QuantumNumberV8[{qn.index}] weights update:")
-            for k in qn.weights:
-                print(f"  {k}: {format_int(before[k])} -> {format_int(qn.weights[k])}")
+            for k, old, new in zip(_KEYS, old_weights, qn.weights):
+                print(f"  {k}: {format_int(old)} -> {format_int(new)}")
             print()
 
     print("=== Final State After All Steps ===")
-    for qn in quantum_numbers:
-        out = qn.forward()
+    for qn, out in zip(quantum_numbers, batch.forward()):
         qn.print_state(out)
 
 if __name__ == "__main__":
@@ -1,4 +1,44 @@
+from collections.abc import MutableMapping
+from operator import mul, sub
+from types import MappingProxyType
+
+
+class _KeyedRow(MutableMapping):
+    """
+    Dict view of one list, keyed by position in keys. Reads and writes go
+    to the list itself; the key set is fixed, so keys cannot be added or
+    removed.
+    """
+
+    __slots__ = ('_positions', '_row')
+
+    def __init__(self, keys, row):
+        self._positions = {k: i for i, k in enumerate(keys)}
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._row[self._positions[key]]
+
+    def __setitem__(self, key, value):
+        self._row[self._positions[key]] = value
+
+    def __delitem__(self, key):
+        raise TypeError("keys of a layer view cannot be removed")
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class QuantumNumberLayer:
+    __slots__ = ('input_keys', 'output_keys', 'bases',
+                 'weight_matrix', 'bias_vector', 'base_vector')
+
     def __init__(self, input_keys, output_keys, bases, initial_weights):
         """
         input_keys: keys for input quantum numbers (e.g., ['a', 'b', 'c'])
@@ -10,49 +50,71 @@ class QuantumNumberLayer:
         self.input_keys = input_keys
         self.output_keys = output_keys
         self.bases = bases
-        self.weights = initial_weights  # nested dict output_key -> input_key -> int weight
-        self.biases = {k: 0 for k in output_keys}  # integer biases
+        # Weights as an |out| x |in| integer matrix, one row per output key,
+        # with integer biases and output bases as |out| vectors
+        self.weight_matrix = [[initial_weights[out_k][in_k] for in_k in input_keys]
+                              for out_k in output_keys]
+        self.bias_vector = [0] * len(output_keys)
+        self.base_vector = [bases[out_k] for out_k in output_keys]
+
+    @property
+    def weights(self):
+        """Nested dict view output_key -> input_key -> int weight; writes update weight_matrix"""
+        return MappingProxyType({out_k: _KeyedRow(self.input_keys, row)
+                                 for out_k, row in zip(self.output_keys, self.weight_matrix)})
+
+    @property
+    def biases(self):
+        """Dict view output_key -> int bias; writes update bias_vector"""
+        return _KeyedRow(self.output_keys, self.bias_vector)
+
+    def forward_vec(self, inp_vec):
+        """
+        inp_vec: list of input quantum numbers ordered as input_keys
+        Returns the outputs as a list ordered as output_keys
+        """
+        # Matrix-vector product plus bias, reduced modulo each output base
+        # to keep the quantum numbers valid
+        return [(b + sum(map(mul, row, inp_vec))) % base
+                for row, b, base in zip(self.weight_matrix, self.bias_vector, self.base_vector)]
+
+    def backward_vec(self, inp_vec, target_vec, out_vec, learning_rate=1):
+        """
+        Rank-1 integer update of the weight matrix and biases from the
+        error (target - output), all vectors ordered as in forward_vec.
+        """
+        bias_vector = self.bias_vector
+        for o, (row, err) in enumerate(zip(self.weight_matrix, map(sub, target_vec, out_vec))):
+            step = learning_rate * err
+            bias_vector[o] += step
+            row[:] = [w + step * v for w, v in zip(row, inp_vec)]
 
     def forward(self, input_qn):
         """
         input_qn: dict of quantum numbers (integer values)
         Returns output_qn: dict of integer quantum numbers
         """
-        output_qn = {}
-        for out_k in self.output_keys:
-            total = self.biases[out_k]
-            for in_k in self.input_keys:
-                w = self.weights[out_k][in_k]
-                v = input_qn[in_k]
-                total += w * v
-            # To keep quantum number valid, reduce modulo base
-            base = self.bases[out_k]
-            output_qn[out_k] = total % base
-        return output_qn
+        inp_vec = [input_qn[in_k] for in_k in self.input_keys]
+        return dict(zip(self.output_keys, self.forward_vec(inp_vec)))
 
     def backward(self, input_qn, target_qn, output_qn, learning_rate=1):
         """
         Compute error (target - output), update weights and biases as integer steps.
         No floating point math used.
         """
-        errors = {}
-        for k in self.output_keys:
-            errors[k] = target_qn[k] - output_qn[k]
-
-        # Update weights and biases
-        for out_k in self.output_keys:
-            self.biases[out_k] += learning_rate * errors[out_k]
-            for in_k in self.input_keys:
-                self.weights[out_k][in_k] += learning_rate * errors[out_k] * input_qn[in_k]
+        self.backward_vec([input_qn[k] for k in self.input_keys],
+                          [target_qn[k] for k in self.output_keys],
+                          [output_qn[k] for k in self.output_keys],
+                          learning_rate)
 
     def __str__(self):
         s = "QuantumNumberLayer state:\n"
         s += "Weights:\n"
-        for out_k in self.output_keys:
-            s += f"  {out_k}: " + ", ".join(f"{in_k}={self.weights[out_k][in_k]}" for in_k in self.input_keys) + "\n"
+        for out_k, row in zip(self.output_keys, self.weight_matrix):
+            s += f"  {out_k}: " + ", ".join(f"{in_k}={w}" for in_k, w in zip(self.input_keys, row)) + "\n"
         s += "Biases:\n"
-        for k in self.output_keys:
-            s += f"  {k}: {self.biases[k]}\n"
+        for k, b in zip(self.output_keys, self.bias_vector):
+            s += f"  {k}: {b}\n"
         return s
 
 
@@ -1,26 +1,77 @@
+def _int_to_digits(abs_val, base):
+    # Carry loop: little-endian digits of a non-negative integer
+    if abs_val == 0:
+        return [0]
+    # Preallocate from the bit length: every base-b digit covers at least
+    # floor(log2(b)) bits, so this never undercounts
+    digits = [0] * (abs_val.bit_length() // (base.bit_length() - 1) + 1)
+    for i in range(len(digits)):
+        abs_val, digits[i] = divmod(abs_val, base)
+        if abs_val == 0:
+            del digits[i + 1:]
+            break
+    return digits
+
+
+def _digits_to_int(digits, base):
+    # Horner evaluation of little-endian digits
+    val = 0
+    for digit in reversed(digits):
+        val = val * base + digit
+    return val
+
+
 class QuantumNumber:
+    __slots__ = ('base', '_sign', '_digits', '_int_cache')
+
     def __init__(self, digits=None, base=10, sign=1):
         self.base = base
-        self.sign = sign  # 1 for positive, -1 for negative
+        # Value of the digits, filled in by to_int() and kept current by add()
+        self._int_cache = None
+        self._sign = sign  # 1 for positive, -1 for negative
         if digits is None:
-            self.digits = [0]
+            self._digits = [0]
         else:
-            self.digits = digits
+            self._digits = digits
             self._normalize()
 
+    @property
+    def sign(self):
+        return self._sign
+
+    @sign.setter
+    def sign(self, value):
+        self._sign = value
+        self._int_cache = None
+
+    @property
+    def digits(self):
+        """
+        Little-endian digit list. Change it by assigning a new list to
+        digits; editing the returned list in place is not seen by the
+        cached to_int() value.
+        """
+        return self._digits
+
+    @digits.setter
+    def digits(self, value):
+        self._digits = value
+        self._int_cache = None
+
     def _normalize(self):
+        digits = self._digits
         # Remove leading zeros
-        while len(self.digits) > 1 and self.digits[-1] == 0:
-            self.digits.pop()
+        while len(digits) > 1 and digits[-1] == 0:
+            digits.pop()
         # If zero, sign always positive
-        if len(self.digits) == 1 and self.digits[0] == 0:
-            self.sign = 1
+        if len(digits) == 1 and digits[0] == 0:
+            self._sign = 1
+        self._int_cache = None
 
     def to_int(self):
-        val = 0
-        for i in reversed(range(len(self.digits))):
-            val = val * self.base + self.digits[i]
-        return val * self.sign
+        if self._int_cache is None:
+            self._int_cache = _digits_to_int(self._digits, self.base) * self._sign
+        return self._int_cache
 
     def add(self, value):
         # Add integer value (can be negative)
@@ -28,28 +79,28 @@ class QuantumNumber:
             return
         current_val = self.to_int()
         new_val = current_val + value
-        self.sign = 1 if new_val >= 0 else -1
-        abs_val = abs(new_val)
-        self.digits = []
-        if abs_val == 0:
-            self.digits = [0]
-            self.sign = 1
-        else:
-            while abs_val > 0:
-                self.digits.append(abs_val % self.base)
-                abs_val //= self.base
+        self._sign = 1 if new_val >= 0 else -1
+        self._digits = _int_to_digits(abs(new_val), self.base)
         self._normalize()
+        self._int_cache = new_val
 
     def __repr__(self):
-        prefix = '-' if self.sign < 0 else ''
-        return prefix + ''.join(str(d) for d in reversed(self.digits))
+        if self.base == 10 and self._digits:
+            # Base-10 digits read the same as the integer value, which is
+            # usually cached, so one int-to-str conversion replaces the join
+            return str(self.to_int())
+        prefix = '-' if self._sign < 0 else ''
+        return prefix + ''.join(str(d) for d in reversed(self._digits))
 
 
 class QuantumNumberLayer:
+    __slots__ = ('base', 'input_keys', 'output_keys', 'verbose', 'weights', 'biases')
+
     def __init__(self, input_keys, output_keys, base=10):
         self.base = base
         self.input_keys = input_keys
         self.output_keys = output_keys
+        self.verbose = False  # report every training step and update
         # Initialize weights and biases as QuantumNumbers (start at zero)
         self.weights = {o: {i: QuantumNumber([0], base) for i in input_keys} for o in output_keys}
         self.biases = {o: QuantumNumber([0], base) for o in output_keys}
@@ -67,9 +118,11 @@ class QuantumNumberLayer:
 
     def train_step(self, inp, target, learning_rate=1):
         output = self.forward(inp)
-        print(f"Input: {inp}")
-        print(f"Output before update: {{'{self.output_keys[0]}': {output[self.output_keys[0]]}, '{self.output_keys[1]}': {output[self.output_keys[1]]}}}")
-        print(f"Target: {target}")
+        verbose = self.verbose
+        if verbose:
+            print(f"Input: {inp}")
+            print(f"Output before update: {{'{self.output_keys[0]}': {output[self.output_keys[0]]}, '{self.output_keys[1]}': {output[self.output_keys[1]]}}}")
+            print(f"Target: {target}")
 
         for o in self.output_keys:
             error = target[o] - output[o].to_int()
@@ -77,13 +130,16 @@ class QuantumNumberLayer:
             for i in self.input_keys:
                 delta = int(error * inp.get(i, 0) * learning_rate)
                 if delta != 0:
-                    print(f"Updating weight[{o}][{i}] by {delta}")
+                    if verbose:
+                        print(f"Updating weight[{o}][{i}] by {delta}")
                     self.weights[o][i].add(delta)
             delta_bias = int(error * learning_rate)
             if delta_bias != 0:
-                print(f"Updating bias[{o}] by {delta_bias}")
+                if verbose:
+                    print(f"Updating bias[{o}] by {delta_bias}")
                 self.biases[o].add(delta_bias)
-        print()
+        if verbose:
+            print()
 
     def print_state(self):
         print("Layer state after updates:")
@@ -103,6 +159,7 @@ def demo24():
     input_keys = ['a', 'b', 'c']
     output_keys = ['x', 'y']
     layer = QuantumNumberLayer(input_keys, output_keys, base=10)
+    layer.verbose = True
 
     training_data = [
         ({'a': 1, 'b': 2, 'c': 3}, {'x': 5, 'y': 4}),
@@ -1,3 +1,6 @@
+from QuantumNumberV8 import coef_property
+
+
 class QuantumNumberV8:
     """
     Represents a symbolic, exact numeric unit designed for
@@ -11,16 +14,22 @@ class QuantumNumberV8:
     Explicit carry management through the left pointer is mandatory.
     """
 
+    __slots__ = ('signs', 'metadata', 'coef',
+                 'left', 'right', 'up', 'down', 'in_', 'out')
+
+    # Coefficients live in the contiguous coef list; a..f are named views
+    a = coef_property(0, 'a')
+    b = coef_property(1, 'b')
+    c = coef_property(2, 'c')
+    d = coef_property(3, 'd')
+    e = coef_property(4, 'e')
+    f = coef_property(5, 'f')
+
     def __init__(self):
         self.signs = 0
         self.metadata = 0
 
-        self.a = 0
-        self.b = 0
-        self.c = 0
-        self.d = 0
-        self.e = 0
-        self.f = 0
+        self.coef = [0, 0, 0, 0, 0, 0]
 
         self.left = None
         self.right = None
@@ -32,51 +41,63 @@ class QuantumNumberV8:
     def __repr__(self):
         def ptr_id(ptr):
             return hex(id(ptr)) if ptr else "None"
+        a, b, c, d, e, f = self.coef
         return (
-            f"QNum(a={self.a},b={self.b},c={self.c},d={self.d},e={self.e},f={self.f},"
+            f"QNum(a={a},b={b},c={c},d={d},e={e},f={f},"
             f" left={ptr_id(self.left)})"
         )
 
     def add(self, other):
         """Add other QuantumNumberV8 to self with explicit carry on left pointer."""
-        carry = QuantumNumberV8()
-        carry_flag = False
-
-        for field in ['a', 'b', 'c', 'd', 'e', 'f']:
-            val = getattr(self, field) + getattr(other, field)
-            if val > 10:  # simple carry threshold
-                carry_flag = True
-                setattr(self, field, val - 10)
-                setattr(carry, field, 1)
-            else:
-                setattr(self, field, val)
-                setattr(carry, field, 0)
-
-        if carry_flag:
-            if self.left:
-                self.left.add(carry)
-            else:
-                self.left = carry
+        self._carry_into(other.coef)
+
+    def _carry_into(self, addend):
+        """Add six coefficients to self, walking the carry up the left chain."""
+        # One carry buffer serves the whole chain: each entry is read as the
+        # addend before being overwritten with the carry for the next node
+        carry = [0, 0, 0, 0, 0, 0]
+        node = self
+        while True:
+            carry_flag = False
+            coef = node.coef
+            for i, v in enumerate(addend):
+                val = coef[i] + v
+                if val > 10:  # simple carry threshold
+                    carry_flag = True
+                    coef[i] = val - 10
+                    carry[i] = 1
+                else:
+                    coef[i] = val
+                    carry[i] = 0
+
+            if not carry_flag:
+                return
+            if node.left is None:
+                node.left = QuantumNumberV8()
+                node.left.coef[:] = carry
+                return
+            node = node.left
+            addend = carry
 
     def scale_by_int(self, scalar):
         """Scale all fields by an integer scalar, handling carry."""
-        carry = QuantumNumberV8()
+        carry = [0, 0, 0, 0, 0, 0]
         carry_flag = False
-        for field in ['a', 'b', 'c', 'd', 'e', 'f']:
-            val = getattr(self, field) * scalar
+        coef = self.coef
+        for i, c in enumerate(coef):
+            val = c * scalar
             if val > 10:
                 carry_flag = True
-                setattr(self, field, val % 10)
-                setattr(carry, field, val // 10)
+                carry[i], coef[i] = divmod(val, 10)
             else:
-                setattr(self, field, val)
-                setattr(carry, field, 0)
+                coef[i] = val
 
         if carry_flag:
             if self.left:
-                self.left.add(carry)
+                self.left._carry_into(carry)
             else:
-                self.left = carry
+                self.left = QuantumNumberV8()
+                self.left.coef[:] = carry
 
 
 class QuantumLayer:
@@ -99,7 +120,7 @@ class QuantumLayer:
             for i, qnum in weight_dict.items():
                 # Multiply qnum by input value (scale by int)
                 tmp = QuantumNumberV8()
-                tmp.a, tmp.b, tmp.c, tmp.d, tmp.e, tmp.f = qnum.a, qnum.b, qnum.c, qnum.d, qnum.e, qnum.f
+                tmp.coef[:] = qnum.coef
                 tmp.scale_by_int(input_vector.get(i, 0))
                 sum_qnum.add(tmp)
             sum_qnum.add(self.biases[o])
@@ -107,6 +128,7 @@ class QuantumLayer:
         return output
 
     def train_step(self, input_vector, target_vector, learning_rate=1):
+        """Update weights and biases; returns the outputs before and after the update."""
         # Compute output
         output = self.forward(input_vector)
 
@@ -127,6 +149,8 @@ class QuantumLayer:
             bias_delta.a = error.a * learning_rate
             self.biases[o].add(bias_delta)
 
+        return output, self.forward(input_vector)
+
 def demo28():
     inputs = ['a', 'b', 'c']
     outputs = ['x', 'y']
@@ -143,13 +167,9 @@ def demo28():
         print(f"=== Epoch {epoch+1} ===")
         for inp, target in training_data:
             print("Input:", inp)
-            out = layer.forward(inp)
+            out, out_after = layer.train_step(inp, target, learning_rate=1)
             print("Output before update:", {k: v.a for k, v in out.items()})
             print("Target:", target)
-
-            layer.train_step(inp, target, learning_rate=1)
-
-            out_after = layer.forward(inp)
             print("Output after update:", {k: v.a for k, v in out_after.items()})
             print("Weights and biases states:")
             for o in outputs:
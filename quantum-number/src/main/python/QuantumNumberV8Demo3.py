@@ -11,6 +11,7 @@ class QuantumNumberV8Demo3:
     """
 
     def __init__(self):
+        self.verbose = False  # print each operation as it is applied
         self.qnum = QuantumNumberV8()
         # Initialize base Quantum Number:
         # (a/(b/c)) * (d/(e/f)) = (10 / (2 / 1)) * (5 / (3 / 1))
@@ -25,33 +26,41 @@ class QuantumNumberV8Demo3:
         """
         Multiply Quantum Number by factor by increasing 'e' (denominator of scaling).
         """
-        print(f"Multiply by {factor} by incrementing 'e' (before): e = {self.qnum.e}")
+        if self.verbose:
+            print(f"Multiply by {factor} by incrementing 'e' (before): e = {self.qnum.e}")
         self.qnum.e += (factor - 1)
-        print(f"After multiplication, e = {self.qnum.e}")
+        if self.verbose:
+            print(f"After multiplication, e = {self.qnum.e}")
 
     def divide_by_factor_f(self, factor: int):
         """
         Divide Quantum Number by factor by increasing 'f' (numerator of denominator in scaling).
         """
-        print(f"Divide by {factor} by incrementing 'f' (before): f = {self.qnum.f}")
+        if self.verbose:
+            print(f"Divide by {factor} by incrementing 'f' (before): f = {self.qnum.f}")
         self.qnum.f += (factor - 1)
-        print(f"After division, f = {self.qnum.f}")
+        if self.verbose:
+            print(f"After division, f = {self.qnum.f}")
 
     def scale_up_d(self, amount: int):
         """
         Scale Quantum Number up by incrementing 'd' (scaling numerator).
         """
-        print(f"Scale up by {amount} via 'd' (before): d = {self.qnum.d}")
+        if self.verbose:
+            print(f"Scale up by {amount} via 'd' (before): d = {self.qnum.d}")
         self.qnum.d += amount
-        print(f"After scaling up, d = {self.qnum.d}")
+        if self.verbose:
+            print(f"After scaling up, d = {self.qnum.d}")
 
     def scale_down_a(self, amount: int):
         """
         Scale down Quantum Number by decrementing 'a' (base numerator).
         """
-        print(f"Scale down by {amount} via 'a' (before): a = {self.qnum.a}")
+        if self.verbose:
+            print(f"Scale down by {amount} via 'a' (before): a = {self.qnum.a}")
         self.qnum.a = max(self.qnum.a - amount, 1)  # avoid zero or negative a
-        print(f"After scaling down, a = {self.qnum.a}")
+        if self.verbose:
+            print(f"After scaling down, a = {self.qnum.a}")
 
     def print_state(self):
         print("Quantum Number state:")
@@ -60,6 +69,7 @@ class QuantumNumberV8Demo3:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo3()
+    demo.verbose = True
     demo.print_state()
 
     demo.multiply_by_factor_e(4)   # multiply by 4 via e
@@ -1,4 +1,4 @@
-from QuantumNumberV8 import QuantumNumberV8
+from QuantumNumberV8 import SIGN_LUT, QuantumNumberV8
 
 class QuantumNumberV8Demo4:
     """
@@ -19,6 +19,15 @@ class QuantumNumberV8Demo4:
 
     SIGN_NAMES = ['a', 'b', 'c', 'd', 'e', 'f']
 
+    # XOR mask of each term's sign bit, in SIGN_NAMES order
+    SIGN_MASKS = [1 << i for i in range(6)]
+
+    # Expression layout: fields 0-5 are the signs of a..f, 6-11 their values
+    EXPR_TEMPLATE = "({0}{6} / ({1}{7} / {2}{8})) * ({3}{9} / ({4}{10} / {5}{11}))"
+
+    # '+'/'-' of each term for every state of the six sign bits
+    SIGN_CHARS = [tuple('-' if m < 0 else '+' for m in mults) for mults in SIGN_LUT]
+
     def __init__(self):
         self.qnum = QuantumNumberV8()
 
@@ -34,18 +43,13 @@ class QuantumNumberV8Demo4:
         self.qnum.signs = 0
 
     def print_state(self):
-        def sign_of(bit_index):
-            return '-' if (self.qnum.signs >> bit_index) & 1 else '+'
-
+        qnum = self.qnum
+        signs = qnum.signs
         # Build string showing each component with its sign
-        parts = []
-        for i, name in enumerate(self.SIGN_NAMES):
-            sign = sign_of(i)
-            val = getattr(self.qnum, name)
-            parts.append(f"{sign}{val}")
-
-        expr_str = f"({parts[0]} / ({parts[1]} / {parts[2]})) * ({parts[3]} / ({parts[4]} / {parts[5]}))"
-        print(f"Quantum Number signs bitfield: {self.qnum.signs:06b}")
+        sign_chars = self.SIGN_CHARS[signs & 0b111111]
+        expr_str = self.EXPR_TEMPLATE.format(
+            *sign_chars, qnum.a, qnum.b, qnum.c, qnum.d, qnum.e, qnum.f)
+        print(f"Quantum Number signs bitfield: {signs:06b}")
         print(f"Quantum Number expression: {expr_str}")
 
     def toggle_sign(self, term_index):
@@ -59,9 +63,9 @@ class QuantumNumberV8Demo4:
         self.print_state()
 
         print("\nToggling signs one by one:")
-        for i, name in enumerate(self.SIGN_NAMES):
+        for name, mask in zip(self.SIGN_NAMES, self.SIGN_MASKS):
             print(f"\nToggle sign of '{name}':")
-            self.toggle_sign(i)
+            self.qnum.signs ^= mask
             self.print_state()
 
         print("\nToggle all signs back to positive:")
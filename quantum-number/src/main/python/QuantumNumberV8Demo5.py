@@ -1,4 +1,4 @@
-from QuantumNumberV8 import QuantumNumberV8
+from QuantumNumberV8 import SIGN_LUT, QuantumNumberV8
 
 class QuantumNumberV8Demo5:
     """
@@ -14,7 +14,14 @@ class QuantumNumberV8Demo5:
 
     SIGN_NAMES = ['a', 'b', 'c', 'd', 'e', 'f']
 
+    # Expression layout: fields 0-5 are the signs of a..f, 6-11 their values
+    EXPR_TEMPLATE = "({0}{6} / ({1}{7} / {2}{8})) * ({3}{9} / ({4}{10} / {5}{11}))"
+
+    # '+'/'-' of each term for every state of the six sign bits
+    SIGN_CHARS = [tuple('-' if m < 0 else '+' for m in mults) for mults in SIGN_LUT]
+
     def __init__(self):
+        self.verbose = False  # print each operation as it is applied
         self.qnum = QuantumNumberV8()
 
         # Start with some default positive values
@@ -27,17 +34,13 @@ class QuantumNumberV8Demo5:
         self.qnum.signs = 0  # all positive
 
     def print_state(self):
-        def sign_of(bit_index):
-            return '-' if (self.qnum.signs >> bit_index) & 1 else '+'
-
-        parts = []
-        for i, name in enumerate(self.SIGN_NAMES):
-            sign = sign_of(i)
-            val = getattr(self.qnum, name)
-            parts.append(f"{sign}{val}")
-
-        expr_str = f"({parts[0]} / ({parts[1]} / {parts[2]})) * ({parts[3]} / ({parts[4]} / {parts[5]}))"
-        print(f"Quantum Number signs bitfield: {self.qnum.signs:06b}")
+        qnum = self.qnum
+        signs = qnum.signs
+        # Build string showing each component with its sign
+        sign_chars = self.SIGN_CHARS[signs & 0b111111]
+        expr_str = self.EXPR_TEMPLATE.format(
+            *sign_chars, qnum.a, qnum.b, qnum.c, qnum.d, qnum.e, qnum.f)
+        print(f"Quantum Number signs bitfield: {signs:06b}")
         print(f"Quantum Number expression: {expr_str}\n")
 
     def toggle_sign_bit(self, term_index):
@@ -51,20 +54,21 @@ class QuantumNumberV8Demo5:
 
         factor: int (can be negative)
         """
-        print(f"Multiplying by {factor}")
+        if self.verbose:
+            print(f"Multiplying by {factor}")
 
         # Handle sign of factor
         if factor < 0:
             # Toggle signs of numerator components (a and d) to represent multiplication by negative
-            self.toggle_sign_bit(0)  # a
-            self.toggle_sign_bit(3)  # d
+            self.qnum.signs ^= 0b001001  # a (bit 0) and d (bit 3) in one XOR
             factor = -factor
 
         # Multiply factor by incrementing 'e' (scaling denominator of scaling coefficient)
         # We'll just add factor to 'e' for demo purposes
         before = self.qnum.e
         self.qnum.e += factor
-        print(f"e before multiply: {before}, after multiply: {self.qnum.e}")
+        if self.verbose:
+            print(f"e before multiply: {before}, after multiply: {self.qnum.e}")
 
     def divide_by(self, divisor):
         """
@@ -73,18 +77,19 @@ class QuantumNumberV8Demo5:
 
         divisor: int (can be negative)
         """
-        print(f"Dividing by {divisor}")
+        if self.verbose:
+            print(f"Dividing by {divisor}")
 
         if divisor < 0:
             # Toggle signs of denominator components (b and e) to represent division by negative
-            self.toggle_sign_bit(1)  # b
-            self.toggle_sign_bit(4)  # e
+            self.qnum.signs ^= 0b010010  # b (bit 1) and e (bit 4) in one XOR
             divisor = -divisor
 
         # Divide by incrementing 'f' (numerator of denominator of scaling coefficient)
         before = self.qnum.f
         self.qnum.f += divisor
-        print(f"f before divide: {before}, after divide: {self.qnum.f}")
+        if self.verbose:
+            print(f"f before divide: {before}, after divide: {self.qnum.f}")
 
     def demo(self):
         print("Initial Quantum Number state:")
@@ -104,4 +109,5 @@ class QuantumNumberV8Demo5:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo5()
+    demo.verbose = True
     demo.demo()
@@ -1,7 +1,17 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import reduce
+from operator import mul, xor
+
+from QuantumNumberV8 import QNumBatch, QuantumNumberV8
+
+def _weighted_sum(fa, wa, fs, ws):
+    # Column kernel: 'a' sum of products and XOR-fold of the product signs.
+    # XOR is associative, so folding each signs column once is the same as
+    # folding the per-feature fs[i] ^ ws[i]
+    return sum(map(mul, fa, wa)), reduce(xor, fs, 0) ^ reduce(xor, ws, 0)
 
 class QuantumNumberV8Demo6:
     def __init__(self):
+        self.verbose = False  # print each operation as it is applied
         # Create a vector of 3 QuantumNumberV8 numbers, simulating features
         self.features = [QuantumNumberV8() for _ in range(3)]
         self.weights = [QuantumNumberV8() for _ in range(3)]
@@ -36,7 +46,8 @@ class QuantumNumberV8Demo6:
         if sign_flip:
             # Flip sign bit of 'a' (bit 0)
             qnum.signs ^= 0b000001
-        print(f"Multiply by {'-' if sign_flip else ''}{factor}: e before={before}, after={qnum.e}, signs={bin(qnum.signs)}")
+        if self.verbose:
+            print(f"Multiply by {'-' if sign_flip else ''}{factor}: e before={before}, after={qnum.e}, signs={bin(qnum.signs)}")
 
     def divide(self, qnum: QuantumNumberV8, factor: int, sign_flip=False):
         """
@@ -48,31 +59,33 @@ class QuantumNumberV8Demo6:
         if sign_flip:
             # Flip sign bit of 'd' (bit 3)
             qnum.signs ^= 0b0001000
-        print(f"Divide by {'-' if sign_flip else ''}{factor}: f before={before}, after={qnum.f}, signs={bin(qnum.signs)}")
+        if self.verbose:
+            print(f"Divide by {'-' if sign_flip else ''}{factor}: f before={before}, after={qnum.f}, signs={bin(qnum.signs)}")
 
     def weighted_sum(self):
         """
         Compute output = sum(features[i] * weights[i]) element-wise.
         Multiplication is symbolic: multiply 'a' terms and add signs accordingly.
         """
-        # Reset output
-        self.output = QuantumNumberV8()
-
-        for i, (f, w) in enumerate(zip(self.features, self.weights)):
-            # Symbolic multiplication:
-            # Multiply 'a' terms
-            prod_a = f.a * w.a
-            # Combine signs XOR for 'a' term
-            prod_signs = f.signs ^ w.signs
-
-            # Accumulate to output 'a' and signs
-            self.output.a += prod_a
-            self.output.signs ^= prod_signs
-
-            print(f"Feature[{i}] * Weight[{i}]: a={f.a}*{w.a}={prod_a}, signs={bin(prod_signs)}")
-
-        print("Weighted sum output 'a':", self.output.a)
-        print("Weighted sum output signs bitfield:", bin(self.output.signs))
+        # Gather features and weights column-wise once, then reduce columns
+        feats = QNumBatch(self.features)
+        weights = QNumBatch(self.weights)
+        # Symbolic multiplication: multiply 'a' terms, combine signs with XOR,
+        # and accumulate to output 'a' and signs
+        out_a, out_signs = _weighted_sum(
+            feats.a, weights.a, feats.signs, weights.signs)
+        # Reuse the output number rather than allocating one per call
+        output = self.output
+        output.reset()
+        output.a = out_a
+        output.signs = out_signs
+
+        if self.verbose:
+            for i, (fa, wa, fs, ws) in enumerate(zip(feats.a, weights.a, feats.signs, weights.signs)):
+                print(f"Feature[{i}] * Weight[{i}]: a={fa}*{wa}={fa * wa}, signs={bin(fs ^ ws)}")
+
+            print("Weighted sum output 'a':", output.a)
+            print("Weighted sum output signs bitfield:", bin(output.signs))
 
     def demo(self):
         print("Initial feature vectors:")
@@ -100,4 +113,5 @@ class QuantumNumberV8Demo6:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo6()
+    demo.verbose = True
     demo.demo()
@@ -1,7 +1,22 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import reduce
+from itertools import accumulate
+from operator import mul, xor
+
+from QuantumNumberV8 import QNumBatch, QuantumNumberV8
+
+def _dot_product(fa, wa, fs, ws, fm, wm):
+    # Column kernel: 'a' sum of products, XOR-fold of the product signs and
+    # max metadata (0 when empty); each column is reduced once, as XOR and
+    # max are both associative
+    return (
+        sum(map(mul, fa, wa)),
+        reduce(xor, fs, 0) ^ reduce(xor, ws, 0),
+        max(max(fm, default=0), max(wm, default=0)),
+    )
 
 class QuantumNumberV8Demo7:
     def __init__(self):
+        self.verbose = False  # print each operation as it is applied
         # Initialize features and weights vectors, like previous demo
         self.features = [QuantumNumberV8() for _ in range(3)]
         self.weights = [QuantumNumberV8() for _ in range(3)]
@@ -35,7 +50,8 @@ class QuantumNumberV8Demo7:
             qnum.signs ^= 0b000001
         # Update metadata: increment version count
         qnum.metadata += 1
-        print(f"Multiply by {'-' if sign_flip else ''}{factor}: e before={before}, after={qnum.e}, signs={bin(qnum.signs)}, metadata={qnum.metadata}")
+        if self.verbose:
+            print(f"Multiply by {'-' if sign_flip else ''}{factor}: e before={before}, after={qnum.e}, signs={bin(qnum.signs)}, metadata={qnum.metadata}")
 
     def divide(self, qnum: QuantumNumberV8, factor: int, sign_flip=False):
         before = qnum.f
@@ -44,7 +60,8 @@ class QuantumNumberV8Demo7:
             # Flip sign bit for 'd' (bit 3)
             qnum.signs ^= 0b0001000
         qnum.metadata += 1
-        print(f"Divide by {'-' if sign_flip else ''}{factor}: f before={before}, after={qnum.f}, signs={bin(qnum.signs)}, metadata={qnum.metadata}")
+        if self.verbose:
+            print(f"Divide by {'-' if sign_flip else ''}{factor}: f before={before}, after={qnum.f}, signs={bin(qnum.signs)}, metadata={qnum.metadata}")
 
     def symbolic_dot_product(self):
         """
@@ -53,21 +70,29 @@ class QuantumNumberV8Demo7:
         combine sign bits with XOR,
         accumulate metadata as max of involved components + 1.
         """
-        self.output = QuantumNumberV8()
-        max_metadata = 0
-
-        for i, (f, w) in enumerate(zip(self.features, self.weights)):
-            prod_a = f.a * w.a
-            prod_signs = f.signs ^ w.signs
-            self.output.a += prod_a
-            self.output.signs ^= prod_signs
-            max_metadata = max(max_metadata, f.metadata, w.metadata)
-
-            print(f"Dot Product [{i}]: {f.a} * {w.a} = {prod_a}, signs={bin(prod_signs)}, max_metadata={max_metadata}")
+        # Gather features and weights column-wise once, then reduce columns
+        feats = QNumBatch(self.features)
+        weights = QNumBatch(self.weights)
+        out_a, out_signs, max_metadata = _dot_product(
+            feats.a, weights.a, feats.signs, weights.signs, feats.metadata, weights.metadata)
+
+        # Reuse the output number rather than allocating one per call
+        output = self.output
+        output.reset()
+        output.a = out_a
+        output.signs = out_signs
+
+        if self.verbose:
+            # Running max of the metadata, as reported after each feature
+            running_max = accumulate(map(max, feats.metadata, weights.metadata), max, initial=0)
+            next(running_max)
+            for i, (fa, wa, fs, ws, m) in enumerate(zip(feats.a, weights.a, feats.signs, weights.signs, running_max)):
+                print(f"Dot Product [{i}]: {fa} * {wa} = {fa * wa}, signs={bin(fs ^ ws)}, max_metadata={m}")
 
         # Set output metadata as max + 1 to indicate new derived state
-        self.output.metadata = max_metadata + 1
-        print(f"Output metadata set to {self.output.metadata}")
+        output.metadata = max_metadata + 1
+        if self.verbose:
+            print(f"Output metadata set to {output.metadata}")
 
     def relu_activation(self, qnum: QuantumNumberV8):
         """
@@ -75,12 +100,13 @@ class QuantumNumberV8Demo7:
         clear that sign bit accordingly.
         """
         if qnum.signs & 0b000001:  # negative 'a'
-            print(f"ReLU activation: 'a' term negative, zeroing out 'a' (was {qnum.a}) and clearing sign bit")
+            if self.verbose:
+                print(f"ReLU activation: 'a' term negative, zeroing out 'a' (was {qnum.a}) and clearing sign bit")
             qnum.a = 0
             qnum.signs &= ~0b000001  # clear bit 0
             # Increase metadata due to transformation
             qnum.metadata += 1
-        else:
+        elif self.verbose:
             print("ReLU activation: 'a' term positive, no change")
 
     def demo(self):
@@ -116,4 +142,5 @@ class QuantumNumberV8Demo7:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo7()
+    demo.verbose = True
     demo.demo()
@@ -1,7 +1,31 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import reduce
+from operator import add, xor
+
+from QuantumNumberV8 import SIGN_LUT, QNumBatch, QuantumNumberV8, add_terms
+
+# Sign bit of each term in the signs bitfield
+_TERM_BIT = {'a': 0, 'b': 1, 'c': 2}
+
+def _signed(col, signs, bit):
+    # Column kernel: apply sign bit `bit` of each signs entry to the column,
+    # branch-free as a multiply by the +1 / -1 looked up in SIGN_LUT
+    return [v * SIGN_LUT[s & 0b111111][bit] for v, s in zip(col, signs)]
+
+def _squared_sums(a, b, c):
+    # Column kernel: per-feature sum of the squared a,b,c terms. A square is
+    # the same whatever the sign bit, so the magnitudes are squared directly
+    return [x * x + y * y + z * z for x, y, z in zip(a, b, c)]
+
+def _chained_metadata(metadata):
+    # Metadata after chaining elementwise_add over the column from 0, where
+    # each add gives max(acc, m) + 1. Unrolled, that is the largest of n and
+    # m_j + (n - j), so one max() call replaces the loop-carried chain
+    n = len(metadata)
+    return max([n, *map(add, metadata, range(n, 0, -1))])
 
 class QuantumNumberV8Demo8:
     def __init__(self):
+        self.verbose = False  # print each operation as it is applied
         # Setup 3 example feature vectors with signs & metadata
         self.features = [QuantumNumberV8() for _ in range(3)]
 
@@ -20,39 +44,35 @@ class QuantumNumberV8Demo8:
 
     def abs_val(self, qnum: QuantumNumberV8, term: str) -> int:
         """Get absolute value of a term, applying sign from signs bitfield."""
-        val = getattr(qnum, term)
-        bit = {'a': 0, 'b': 1, 'c': 2}[term]
-        sign_bit_set = (qnum.signs >> bit) & 1
-        return -val if sign_bit_set else val
+        bit = _TERM_BIT[term]
+        # Branch-free negation: multiply by +1 or -1
+        return getattr(qnum, term) * SIGN_LUT[qnum.signs & 0b111111][bit]
 
     def normalize_features(self):
         """Normalize each feature vector's 'a' term by sum of abs of 'a' in all features."""
-        total_abs_a = sum(abs(f.a) for f in self.features)
+        features = self.features
+        col_a = [f.a for f in features]
+        total_abs_a = sum(map(abs, col_a))
         if total_abs_a == 0:
-            print("Normalization skipped: total absolute 'a' term is zero")
+            if self.verbose:
+                print("Normalization skipped: total absolute 'a' term is zero")
             return
 
-        for i, f in enumerate(self.features):
-            old_a = f.a
-            normalized_a = f.a / total_abs_a  # Keep sign by dividing actual value
+        # Keep sign by dividing actual value, one pass over the column
+        normalized = [a / total_abs_a for a in col_a]
+        for i, (f, old_a, normalized_a) in enumerate(zip(features, col_a, normalized)):
             f.a = normalized_a
             f.metadata += 1
-            print(f"Normalized feature[{i}] 'a': {old_a} -> {normalized_a} (metadata={f.metadata})")
+            if self.verbose:
+                print(f"Normalized feature[{i}] 'a': {old_a} -> {normalized_a} (metadata={f.metadata})")
 
     def elementwise_add(self, q1: QuantumNumberV8, q2: QuantumNumberV8) -> QuantumNumberV8:
         """Element-wise addition of a,b,c terms, managing signs bitwise by XOR."""
         result = QuantumNumberV8()
-        for term, bit in zip(['a', 'b', 'c'], [0,1,2]):
-            val1 = self.abs_val(q1, term)
-            val2 = self.abs_val(q2, term)
-            sum_val = val1 + val2
-            sign_bit = 0 if sum_val >= 0 else 1
-            setattr(result, term, abs(sum_val))
-            # Set or clear sign bit accordingly
-            if sign_bit:
-                result.signs |= (1 << bit)
-            else:
-                result.signs &= ~(1 << bit)
+        # Only the a,b,c sign bits take part, so mask the rest out of the key
+        result.a, result.b, result.c, result.signs = add_terms(
+            q1.a, q1.b, q1.c, q1.signs & 0b111,
+            q2.a, q2.b, q2.c, q2.signs & 0b111)
 
         # Combine metadata as max + 1 (operation count)
         result.metadata = max(q1.metadata, q2.metadata) + 1
@@ -64,38 +84,46 @@ class QuantumNumberV8Demo8:
         sum_i sum_terms (feature_i.term * feature_i.term),
         combine sign bits with XOR for all terms.
         """
+        feats = QNumBatch(self.features)
+        signs = feats.signs
+        # Square as example
+        partial_sums = _squared_sums(feats.a, feats.b, feats.c)
+
         output = QuantumNumberV8()
-        max_metadata = 0
-        for i, f in enumerate(self.features):
-            partial_sum = 0
-            combined_signs = 0
-            for term, bit in zip(['a','b','c'], [0,1,2]):
-                val = self.abs_val(f, term)
-                partial_sum += val * val  # Square as example
-                # XOR sign bits (term-level)
-                if (f.signs >> bit) & 1:
-                    combined_signs ^= (1 << bit)
-            output.a += partial_sum
-            output.signs ^= combined_signs
-            max_metadata = max(max_metadata, f.metadata)
-
-            print(f"Feature[{i}] squared sum: {partial_sum}, combined signs: {bin(combined_signs)}")
-
-        output.metadata = max_metadata + 1
+        output.a = sum(partial_sums)
+        # XOR of the a,b,c sign bits (term-level) is just those bits, so fold
+        # the signs column once and mask the result
+        output.signs = reduce(xor, signs, 0) & 0b111
+        if self.verbose:
+            for i, (partial_sum, s) in enumerate(zip(partial_sums, signs)):
+                print(f"Feature[{i}] squared sum: {partial_sum}, combined signs: {bin(s & 0b111)}")
+
+        output.metadata = max(feats.metadata, default=0) + 1
         return output
 
     def batch_sum(self, qnums):
         """Sum a list of QuantumNumberV8 elementwise, similar to elementwise_add chained."""
+        # Chaining elementwise_add keeps the exact signed running sum of each
+        # term, so each term is one column sum; only the sign bit of the final
+        # sum is kept, and metadata steps as max + 1 once per add
+        batch = QNumBatch(qnums)
+        signs = batch.signs
+        sa = sum(_signed(batch.a, signs, 0))
+        sb = sum(_signed(batch.b, signs, 1))
+        sc = sum(_signed(batch.c, signs, 2))
         total = QuantumNumberV8()
-        for q in qnums:
-            total = self.elementwise_add(total, q)
-        print(f"Batch sum metadata: {total.metadata}")
+        total.a, total.b, total.c = abs(sa), abs(sb), abs(sc)
+        total.signs = (sa < 0) | ((sb < 0) << 1) | ((sc < 0) << 2)
+        total.metadata = _chained_metadata(batch.metadata)
+        if self.verbose:
+            print(f"Batch sum metadata: {total.metadata}")
         return total
 
     def quantum_number_distance(self, q1: QuantumNumberV8, q2: QuantumNumberV8):
         """Sum of absolute differences of 'a' terms (sign-aware)."""
         diff = abs(self.abs_val(q1, 'a') - self.abs_val(q2, 'a'))
-        print(f"Quantum Number distance (|a1 - a2|): {diff}")
+        if self.verbose:
+            print(f"Quantum Number distance (|a1 - a2|): {diff}")
         return diff
 
     def demo(self):
@@ -130,4 +158,5 @@ class QuantumNumberV8Demo8:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo8()
+    demo.verbose = True
     demo.demo()
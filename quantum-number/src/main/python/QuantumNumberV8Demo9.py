@@ -1,7 +1,48 @@
-from QuantumNumberV8 import QuantumNumberV8
+from functools import lru_cache
+
+from QuantumNumberV8 import SIGN_LUT, QNumBatch, QuantumNumberV8, add_terms
+
+# Sign bit of each term in the signs bitfield
+_TERM_BIT = {'a': 0, 'b': 1, 'c': 2}
+
+# 1 / (1 + dist) for small integer distances, looked up by quantum_similarity
+_RECIP_1P = tuple(1 / (1 + i) for i in range(1024))
+
+# Memoized: it returns magnitudes and sign bits, which match for 0.0 and -0.0 keys
+@lru_cache(maxsize=4096, typed=True)
+def _multiply_terms(a1, b1, c1, signs1, a2, b2, c2, signs2):
+    # Cached kernel: sign-aware product of the a,b,c terms of two numbers, as
+    # the magnitudes of the products plus their sign bits
+    # Unrolled over the three terms; bit 0/1/2 of the signs is 'a'/'b'/'c'
+    m1 = SIGN_LUT[signs1]
+    m2 = SIGN_LUT[signs2]
+    pa = a1 * m1[0] * (a2 * m2[0])
+    pb = b1 * m1[1] * (b2 * m2[1])
+    pc = c1 * m1[2] * (c2 * m2[2])
+    return abs(pa), abs(pb), abs(pc), (pa < 0) | ((pb < 0) << 1) | ((pc < 0) << 2)
+
+def _sigmoid_terms(a, a_negative, k):
+    # Kernel: (a, b, signs) of the symbolic sigmoid a / (a + k). Not cached:
+    # it returns the signed 'a', and a cache key cannot tell 0.0 from -0.0
+    a_val = a * (1 - 2 * a_negative)
+    return a_val, a_val + k, a_negative
+
+def _sigmoid_columns(a, signs, metadata, k):
+    # Column kernel: _sigmoid_terms over every row, returned as the a, b,
+    # signs and metadata columns of the results
+    out_a = []
+    out_b = []
+    out_signs = []
+    for v, s in zip(a, signs):
+        ra, rb, rs = _sigmoid_terms(v, s & 1, k)
+        out_a.append(ra)
+        out_b.append(rb)
+        out_signs.append(rs)
+    return out_a, out_b, out_signs, [m + 1 for m in metadata]
 
 class QuantumNumberV8Demo9:
     def __init__(self):
+        self.verbose = False  # print each operation as it is applied
         self.features = [QuantumNumberV8() for _ in range(3)]
 
         self.features[0].a, self.features[0].b, self.features[0].c = 6, -2, 1
@@ -17,22 +58,26 @@ class QuantumNumberV8Demo9:
         self.features[2].metadata = 1
 
     def abs_val(self, qnum: QuantumNumberV8, term: str) -> int:
-        val = getattr(qnum, term)
-        bit = {'a': 0, 'b': 1, 'c': 2}[term]
-        return -val if ((qnum.signs >> bit) & 1) else val
+        bit = _TERM_BIT[term]
+        # Branch-free negation: multiply by +1 or -1
+        return getattr(qnum, term) * SIGN_LUT[qnum.signs & 0b111111][bit]
 
     def elementwise_multiply(self, q1: QuantumNumberV8, q2: QuantumNumberV8) -> QuantumNumberV8:
         result = QuantumNumberV8()
-        for term, bit in zip(['a', 'b', 'c'], [0,1,2]):
-            val1 = self.abs_val(q1, term)
-            val2 = self.abs_val(q2, term)
-            prod = val1 * val2
-            sign_bit = 1 if prod < 0 else 0
-            setattr(result, term, abs(prod))
-            if sign_bit:
-                result.signs |= (1 << bit)
-            else:
-                result.signs &= ~(1 << bit)
+        # Only the a,b,c sign bits take part, so mask the rest out of the key
+        result.a, result.b, result.c, result.signs = _multiply_terms(
+            q1.a, q1.b, q1.c, q1.signs & 0b111,
+            q2.a, q2.b, q2.c, q2.signs & 0b111)
+
+        result.metadata = max(q1.metadata, q2.metadata) + 1
+        return result
+
+    def elementwise_add(self, q1: QuantumNumberV8, q2: QuantumNumberV8) -> QuantumNumberV8:
+        result = QuantumNumberV8()
+        # Signed sum of each term; only the a,b,c sign bits take part
+        result.a, result.b, result.c, result.signs = add_terms(
+            q1.a, q1.b, q1.c, q1.signs & 0b111,
+            q2.a, q2.b, q2.c, q2.signs & 0b111)
 
         result.metadata = max(q1.metadata, q2.metadata) + 1
         return result
@@ -44,37 +89,55 @@ class QuantumNumberV8Demo9:
         We'll simulate division by 'adding k to a' and swapping roles for demo.
         """
         result = QuantumNumberV8()
-        # Preserve signs from input 'a'
-        a_val = self.abs_val(qnum, 'a')
-        # symbolic approximation: sigmoid ~ a/(a+k)
-        result.a = a_val
-        result.b = a_val + k  # denominator term
-
-        # Signs: If input 'a' negative, result 'a' negative sign, 'b' positive sign
-        if (qnum.signs & 1) != 0:
-            result.signs |= 1  # 'a' negative
-        # 'b' always positive for denominator
+        # symbolic approximation: sigmoid ~ a/(a+k), with 'b' the denominator term.
+        # Signs: if input 'a' negative, result 'a' negative; 'b' always positive
+        result.a, result.b, result.signs = _sigmoid_terms(qnum.a, qnum.signs & 1, k)
 
         result.metadata = qnum.metadata + 1
         return result
 
+    def quantum_sigmoid_batch(self, qnums, k=1):
+        """
+        quantum_sigmoid applied to every number in qnums at once.
+        The a, signs and metadata columns are gathered once and transformed
+        column-wise; one new QuantumNumberV8 is returned per input.
+        """
+        batch = QNumBatch(qnums)
+        results = []
+        for a, b, signs, metadata in zip(*_sigmoid_columns(batch.a, batch.signs, batch.metadata, k)):
+            result = QuantumNumberV8()
+            result.a, result.b, result.signs = a, b, signs
+            result.metadata = metadata
+            results.append(result)
+        return results
+
     def normalize_by_sum_a(self):
-        total_abs_a = sum(abs(f.a) for f in self.features)
+        features = self.features
+        col_a = [f.a for f in features]
+        total_abs_a = sum(map(abs, col_a))
         if total_abs_a == 0:
-            print("Normalization skipped: sum abs a is zero")
+            if self.verbose:
+                print("Normalization skipped: sum abs a is zero")
             return
-        for i, f in enumerate(self.features):
-            old_a = f.a
-            f.a = f.a / total_abs_a
+        normalized = [a / total_abs_a for a in col_a]
+        for i, (f, old_a, new_a) in enumerate(zip(features, col_a, normalized)):
+            f.a = new_a
             f.metadata += 1
-            print(f"Normalized feature[{i}] a: {old_a} -> {f.a} (metadata={f.metadata})")
+            if self.verbose:
+                print(f"Normalized feature[{i}] a: {old_a} -> {f.a} (metadata={f.metadata})")
 
     def quantum_similarity(self, q1: QuantumNumberV8, q2: QuantumNumberV8):
         # similarity = dot product on 'a' + (1 / (1 + distance))
         dot = self.abs_val(q1, 'a') * self.abs_val(q2, 'a')
         dist = abs(self.abs_val(q1, 'a') - self.abs_val(q2, 'a'))
-        sim = dot + 1/(1 + dist)
-        print(f"Quantum similarity between a's: dot={dot}, distance={dist}, similarity={sim}")
+        # Integer distances in range come from the table; anything else (e.g.
+        # float 'a' terms after normalization) is divided out as before
+        if isinstance(dist, int) and dist < len(_RECIP_1P):
+            sim = dot + _RECIP_1P[dist]
+        else:
+            sim = dot + 1/(1 + dist)
+        if self.verbose:
+            print(f"Quantum similarity between a's: dot={dot}, distance={dist}, similarity={sim}")
         return sim
 
     def demo(self):
@@ -89,18 +152,12 @@ class QuantumNumberV8Demo9:
         print()
 
         print("Apply quantum sigmoid on multiply result:")
-        sigmoid_result = self.quantum_sigmoid(mult_result)
+        sigmoid_result, = self.quantum_sigmoid_batch([mult_result])
         print("Sigmoid result:", sigmoid_result)
         print()
 
         print("Add sigmoid result to feature 2 elementwise:")
-        add_result = QuantumNumberV8()
-        for term in ['a', 'b', 'c']:
-            v = getattr(sigmoid_result, term) + getattr(self.features[2], term)
-            setattr(add_result, term, v)
-        # Combine signs by XOR (just for demo)
-        add_result.signs = sigmoid_result.signs ^ self.features[2].signs
-        add_result.metadata = max(sigmoid_result.metadata, self.features[2].metadata) + 1
+        add_result = self.elementwise_add(sigmoid_result, self.features[2])
         print("Add result:", add_result)
         print()
 
@@ -116,4 +173,5 @@ class QuantumNumberV8Demo9:
 
 if __name__ == "__main__":
     demo = QuantumNumberV8Demo9()
+    demo.verbose = True
     demo.demo()